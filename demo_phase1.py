@@ -8,13 +8,15 @@ Project: AI Research Paper Analysis & Grant Proposal Generator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Mapping
+from types import MappingProxyType
 from enum import Enum
-import queue
+from array import array
 import threading
 import time
 import json
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 
 
 # =============================== MESSAGE SYSTEM ======================
@@ -65,34 +67,130 @@ class Message:
         return f"Message({self.sender}→{self.recipient}: {self.message_type.value})"
     
 
+class _PriorityInbox:
+    """One agent's inbox: a FIFO deque per Priority level"""
+
+    def __init__(self):
+        # Indexed by Priority.value, so the highest priority is the last bucket
+        self._buckets = [deque() for _ in range(max(p.value for p in Priority) + 1)]
+        self._not_empty = threading.Condition(threading.Lock())
+        self._wakeups = 0
+
+    def _ready(self) -> bool:
+        return self._wakeups > 0 or any(self._buckets)
+
+    def put(self, message: Message):
+        with self._not_empty:
+            self._buckets[message.priority.value].append(message)
+            self._not_empty.notify()
+
+    def wake(self):
+        """Make one blocked (or the next) get() return None"""
+        with self._not_empty:
+            self._wakeups += 1
+            self._not_empty.notify()
+
+    def get(self, timeout: float) -> Optional[Message]:
+        """Pop the oldest message of the highest priority, None on timeout or wake"""
+        with self._not_empty:
+            if not self._not_empty.wait_for(self._ready, timeout):
+                return None
+            if self._wakeups:
+                self._wakeups -= 1
+                return None
+            for bucket in reversed(self._buckets):
+                if bucket:
+                    return bucket.popleft()
+
+    def qsize(self) -> int:
+        return sum(map(len, self._buckets))
+
+    def clear(self):
+        with self._not_empty:
+            for bucket in self._buckets:
+                bucket.clear()
+
+
 class MessageQueue:
     """Central message queue for agent communication"""
 
+    RECENT_HISTORY_SIZE = 50
+    DISPLAY_HISTORY_SIZE = 10
+
     def __init__(self):
-        self.queues: Dict[str, queue.PriorityQueue] = defaultdict(queue.PriorityQueue)
+        self.queues: Dict[str, _PriorityInbox] = defaultdict(_PriorityInbox)
         self.message_history: List[Message] = []
+        self.recent_messages: deque = deque(maxlen=self.RECENT_HISTORY_SIZE)
+        # (time, sender, recipient, type) tuples, most recent first
+        self.recent_display: deque = deque(maxlen=self.DISPLAY_HISTORY_SIZE)
         self.lock = threading.Lock()
         self._running = False
-    
+        self._listeners: List[Callable[[], None]] = []
+        self.mutations = 0
+
+    def add_listener(self, callback: Callable[[], None]):
+        """Register a callback fired on every state change (called from agent threads)"""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]):
+        """Unregister a state-change callback"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def notify_change(self):
+        """Notify listeners that messages, tasks or agent states changed"""
+        self.mutations += 1
+        for callback in list(self._listeners):
+            callback()
+    
+    def _enqueue(self, message: Message):
+        """Queue and log a message (caller holds self.lock)"""
+        # Add to recipient's inbox (highest priority first, FIFO within a priority)
+        self.queues[message.recipient].put(message)
+        
+        # Log to history
+        self.message_history.append(message)
+        self.recent_messages.append(message)
+        self.recent_display.appendleft((
+            message.timestamp.strftime('%H:%M:%S'),
+            message.sender[:12],
+            message.recipient[:12],
+            message.message_type.value
+        ))
+
     def send(self, message: Message):
         """Send message to recipient's queue"""
         with self.lock:
-            # Add to recipient's queue (priority queue: lower number = higher priority)
-            priority_value = 6 - message.priority.value  # Invert for PriorityQueue
-            self.queues[message.recipient].put((priority_value, message))
-            
-            # Log to history
-            self.message_history.append(message)
-            
+            self._enqueue(message)
             print(f"📨 {message.sender} → {message.recipient}: {message.message_type.value}")
 
+        self.notify_change()
+
+    def send_many(self, messages: List[Message], batch_size: int = 64):
+        """
+        Send several messages, taking the lock once per batch
+        
+        Smaller batches keep lock hold times (and latency for other
+        senders) short; larger ones amortize more overhead.
+        """
+        for start in range(0, len(messages), batch_size):
+            batch = messages[start:start + batch_size]
+            with self.lock:
+                for message in batch:
+                    self._enqueue(message)
+                print("\n".join(
+                    f"📨 {m.sender} → {m.recipient}: {m.message_type.value}" for m in batch
+                ))
+
+            self.notify_change()
+
     def receive(self, agent_name: str, timeout: float = 0.1) -> Optional[Message]:
         """Receive message from agent's queue (non-blocking)"""
-        try:
-            priority, message = self.queues[agent_name].get(timeout=timeout)
-            return message
-        except queue.Empty:
-            return None
+        return self.queues[agent_name].get(timeout)
+
+    def wake(self, agent_name: str):
+        """Wake an agent blocked in receive() without delivering a message"""
+        self.queues[agent_name].wake()
     
     def broadcast(self, message: Message, recipients: List[str]):
         """Send message to multiple recipients"""
@@ -108,12 +206,15 @@ class MessageQueue:
     
     def get_history(self, limit: int = 50) -> List[Message]:
         """Get recent message history"""
+        if 0 < limit <= self.RECENT_HISTORY_SIZE:
+            recent = self.recent_messages
+            return list(islice(recent, max(len(recent) - limit, 0), None))
         return self.message_history[-limit:]
     
     def clear_queue(self, agent_name: str):
         """Clear all messages for an agent"""
         with self.lock:
-            self.queues[agent_name] = queue.PriorityQueue()
+            self.queues[agent_name].clear()
 
 #=========================== BASE AGENT ============================
 
@@ -128,6 +229,10 @@ class AgentState(Enum):
 class BaseAgent(ABC):
     """Abstract base class for all agents"""
 
+    # How long an idle agent blocks waiting for a message before re-checking
+    # its stop flag; stop() wakes it immediately
+    IDLE_WAIT = 1.0
+
 
     def __init__(self, name: str, role: str, message_queue: MessageQueue):
         self.name = name
@@ -135,12 +240,40 @@ class BaseAgent(ABC):
         self.message_queue = message_queue
         self.state = AgentState.IDLE
         self.processing_history: List[Dict] = []
-        self.error_count = 0
         self._stop_flag = False
+
+        # Counters live in per-system arrays once registered (see MultiAgentSystem)
+        self._msg_counts = array('Q', [0])
+        self._err_counts = array('Q', [0])
+        self._idx = 0
         self._thread: Optional[threading.Thread] = None
         
         print(f"✅ {self.name} ({self.role}) initialized")
     
+    @property
+    def messages_processed(self) -> int:
+        """Number of messages processed (successfully or not)"""
+        return self._msg_counts[self._idx]
+
+    @property
+    def error_count(self) -> int:
+        """Number of messages that failed processing"""
+        return self._err_counts[self._idx]
+
+    def attach_counters(self, msg_counts: array, err_counts: array, idx: int):
+        """Move this agent's counters into shared system-wide arrays"""
+        msg_counts[idx] = self.messages_processed
+        err_counts[idx] = self.error_count
+        self._msg_counts = msg_counts
+        self._err_counts = err_counts
+        self._idx = idx
+
+    def _set_state(self, state: AgentState):
+        """Transition to a new state and notify listeners"""
+        if self.state != state:
+            self.state = state
+            self.message_queue.notify_change()
+
     @abstractmethod
     def process(self, message: Message) -> Dict[str, Any]:
         """
@@ -198,6 +331,7 @@ class BaseAgent(ABC):
             'result_summary': str(result)[:100]
         }
         self.processing_history.append(log_entry)
+        self._msg_counts[self._idx] += 1
         
         # Keep only last 100 entries
         if len(self.processing_history) > 100:
@@ -211,13 +345,13 @@ class BaseAgent(ABC):
         while not self._stop_flag:
             try:
                 # Check for incoming messages
-                message = self.message_queue.receive(self.name)
+                message = self.message_queue.receive(self.name, timeout=self.IDLE_WAIT)
                 
                 if message:
                     print(f"📬 {self.name} received: {message.message_type.value} from {message.sender}")
                     
                     # Update state
-                    self.state = AgentState.PROCESSING
+                    self._set_state(AgentState.PROCESSING)
                     
                     # Process message
                     try:
@@ -230,23 +364,20 @@ class BaseAgent(ABC):
                         
                     except Exception as e:
                         print(f"❌ {self.name} error: {e}")
-                        self.error_count += 1
-                        self.state = AgentState.ERROR
+                        self._err_counts[self._idx] += 1
+                        self._set_state(AgentState.ERROR)
                         self.log_processing(message, str(e), success=False)
                         self.send_error(message.sender, str(e))
                     
                     # Return to idle
-                    self.state = AgentState.IDLE
-                
-                # Small sleep to prevent CPU spinning
-                time.sleep(0.1)
+                    self._set_state(AgentState.IDLE)
                 
             except Exception as e:
                 print(f"💥 {self.name} critical error in main loop: {e}")
-                self.state = AgentState.ERROR
+                self._set_state(AgentState.ERROR)
                 time.sleep(1)
         
-        self.state = AgentState.STOPPED
+        self._set_state(AgentState.STOPPED)
         print(f"🛑 {self.name} stopped")
     
 
@@ -256,6 +387,7 @@ class BaseAgent(ABC):
             self._stop_flag = False
             self._thread = threading.Thread(target=self.run, daemon=True)
             self._thread.start()
+            self.message_queue.notify_change()
             print(f"▶️ {self.name} thread started")
     
 
@@ -264,6 +396,7 @@ class BaseAgent(ABC):
         print(f"⏸️ Stopping {self.name}...")
         self._stop_flag = True
         if self._thread:
+            self.message_queue.wake(self.name)
             self._thread.join(timeout=5)
     
     
@@ -273,7 +406,7 @@ class BaseAgent(ABC):
             'name': self.name,
             'role': self.role,
             'state': self.state.value,
-            'messages_processed': len(self.processing_history),
+            'messages_processed': self.messages_processed,
             'error_count': self.error_count,
             'is_alive': self._thread.is_alive() if self._thread else False
         }
@@ -345,6 +478,7 @@ class SupervisorAgent(BaseAgent):
         }
         
         self.active_tasks[task_id] = task
+        self.message_queue.notify_change()
         
         # Route to appropriate agents based on task type
         if task_type == 'analyze_paper':
@@ -453,9 +587,9 @@ class SupervisorAgent(BaseAgent):
     
 
      
-    def get_all_tasks(self) -> Dict[str, Dict]:
-        """Get all active tasks"""
-        return self.active_tasks
+    def get_all_tasks(self) -> Mapping[str, Dict]:
+        """Get all active tasks (read-only view, not a copy)"""
+        return MappingProxyType(self.active_tasks)
     
     def complete_task(self, task_id: str):
         """Mark task as complete"""
@@ -464,6 +598,7 @@ class SupervisorAgent(BaseAgent):
             task['status'] = 'completed'
             task['completed_at'] = datetime.now().isoformat()
             self.completed_tasks.append(task)
+            self.message_queue.notify_change()
             print(f"✅ Task {task_id} completed")
 
 
@@ -478,15 +613,49 @@ class MultiAgentSystem:
         self.agents: Dict[str, BaseAgent] = {
             'supervisor': self.supervisor
         }
+
+        # Struct-of-arrays agent counters, indexed by agent._idx
+        self._msg_counts = array('Q')
+        self._err_counts = array('Q')
+        self._attach_agent_counters(self.supervisor)
         
         print("🚀 Multi-Agent System initialized")
     
 
     def register_agent(self, agent: BaseAgent):
         """Register a new agent with the system"""
+        existing = self.agents.get(agent.name)
+        if existing is None:
+            self._attach_agent_counters(agent)
+        elif existing is not agent:
+            # Replacement agent takes over the previous agent's slot
+            agent.attach_counters(self._msg_counts, self._err_counts, existing._idx)
         self.agents[agent.name] = agent
         self.supervisor.register_agent(agent.name, agent.role)
         print(f"✅ Agent {agent.name} registered")
+
+    def _attach_agent_counters(self, agent: BaseAgent):
+        """Give the agent a slot in the system counter arrays"""
+        self._msg_counts.append(0)
+        self._err_counts.append(0)
+        agent.attach_counters(self._msg_counts, self._err_counts, len(self._msg_counts) - 1)
+
+    def get_counter_totals(self) -> tuple:
+        """Total (messages_processed, error_count) across all agents"""
+        return sum(self._msg_counts), sum(self._err_counts)
+
+    @property
+    def mutation_counter(self) -> int:
+        """Counter bumped on every message, task or agent state change"""
+        return self.message_queue.mutations
+
+    def add_change_listener(self, callback: Callable[[], None]):
+        """Subscribe to system state changes (messages, tasks, agent states)"""
+        self.message_queue.add_listener(callback)
+
+    def remove_change_listener(self, callback: Callable[[], None]):
+        """Unsubscribe from system state changes"""
+        self.message_queue.remove_listener(callback)
     
 
     def start_all_agents(self):
@@ -534,16 +703,24 @@ class MultiAgentSystem:
         """Get overall system status"""
         return {
             'agents': {name: agent.get_status() for name, agent in self.agents.items()},
-            'message_queue_size': sum(q.qsize() for q in self.message_queue.queues.values()),
+            'message_queue_size': self.pending_message_count(),
             'active_tasks': len(self.supervisor.active_tasks),
             'completed_tasks': len(self.supervisor.completed_tasks)
         }
     
+    def pending_message_count(self) -> int:
+        """Number of messages waiting in agent queues"""
+        return sum(q.qsize() for q in list(self.message_queue.queues.values()))
+
     def get_message_history(self, limit: int = 20) -> List[Dict]:
         """Get recent message history"""
         messages = self.message_queue.get_history(limit)
         return [msg.to_dict() for msg in messages]
 
+    def get_recent_messages_view(self) -> tuple:
+        """Last few messages as preformatted (time, sender, recipient, type), most recent first"""
+        return tuple(self.message_queue.recent_display)
+
 
 # ==================== DEMO & TESTING ====================
 
@@ -3,18 +3,130 @@ Multi-Agent System - Real-Time Monitoring Dashboard
 Live visualization of agent activity and message flow
 """
 
+import asyncio
+import io
+import sys
 import time
-from datetime import datetime
+from dataclasses import dataclass
+from typing import Callable
 from demo_phase1 import MultiAgentSystem, MessageType, Priority
 import json
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Separator bars, built once
+_BAR_EQ = "=" * 80
+_BAR_DASH = "-" * 80
+_BAR_EQ_N = _BAR_EQ + "\n"
+_BAR_DASH_N = _BAR_DASH + "\n"
+_BAR_EQ_60 = "=" * 60
+
+# Display lookups for agent states and message types
+_STATE_GLYPH = {
+    'idle': '🟢 idle',
+    'processing': '🟡 processing',
+    'error': '🔴 error'
+}
+_STATE_DEFAULT = '⚪'
+
+# Pre-padded state column for the agent table
+_STATE_COL = {state: f"{glyph:<20} " for state, glyph in _STATE_GLYPH.items()}
+
+_MSG_ICON = {
+    'request': '📤',
+    'response': '📥',
+    'error': '⚠️'
+}
+_MSG_ICON_DEFAULT = '📨'
+
+
+def _has_nonfinite(data) -> bool:
+    """True if data contains a NaN/inf float (orjson would write it as null)"""
+    if isinstance(data, float):
+        return data != data or data in (float('inf'), float('-inf'))
+    if isinstance(data, dict):
+        return any(map(_has_nonfinite, data.values()))
+    if isinstance(data, (list, tuple)):
+        return any(map(_has_nonfinite, data))
+    return False
+
+
+def format_json(data) -> str:
+    """Pretty-print JSON, using orjson when it is installed and gives the same output"""
+    if orjson is not None and not _has_nonfinite(data):
+        try:
+            return orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass  # Let json.dumps handle (or report) it
+    return json.dumps(data, indent=2)
+
+
+def run_async(coro):
+    """Run a coroutine to completion, on uvloop when it is installed"""
+    if uvloop is not None:
+        uvloop.install()
+    return asyncio.run(coro)
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """Everything one monitor frame shows, gathered in a single pass"""
+    agents: tuple    # (name, status) pairs
+    tasks: tuple     # First 5 (task_id, task) pairs
+    messages: tuple  # (time, sender, recipient, type), most recent first
+    totals: tuple    # (active_agents, total_agents, queue_size, active_tasks,
+                     #  completed_tasks, total_messages, total_errors)
+
+
+class SnapshotCache:
+    """Reuses the last snapshot until the system changes or it expires"""
+
+    def __init__(self, builder: Callable[[], FrameSnapshot]):
+        self.builder = builder
+        self._key = None
+        self._snapshot = None
+
+    def get_or_build(self, ttl: float, mutation_counter: int) -> FrameSnapshot:
+        """Return the cached snapshot, rebuilding it if stale (ttl <= 0: always)"""
+        if ttl <= 0:
+            self._snapshot = self.builder()
+            self._key = None
+            return self._snapshot
+
+        key = (int(time.monotonic() / ttl), mutation_counter)
+
+        if key != self._key:
+            self._snapshot = self.builder()
+            self._key = key
+
+        return self._snapshot
+
 
 class SystemMonitor:
     """Real-time monitoring and visualization"""
     
     def __init__(self, system: MultiAgentSystem):
         self.system = system
-        self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
+        self._uptime_seconds = -1
+        self._uptime_str = ""
+        self.refresh_rate = 1.0
+        self.cache = SnapshotCache(self._build_frame_snapshot)
+        self._out = io.StringIO()  # Frame buffer, written in one go per display()
+        self._name_cols = {}  # Agent name -> padded name column
+        self._prev_row = {}  # Agent name -> (row key, rendered row)
+        self._prev_metrics = (None, "")  # (metrics key, rendered block)
     
     def clear_screen(self):
         """Clear terminal (cross-platform)"""
@@ -23,152 +135,217 @@ class SystemMonitor:
     
     def format_uptime(self) -> str:
         """Format system uptime"""
-        elapsed = datetime.now() - self.start_time
-        hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
-        minutes, seconds = divmod(remainder, 60)
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        elapsed = int(time.monotonic() - self.start_monotonic)
+        
+        # Only re-format when a full second has passed
+        if elapsed != self._uptime_seconds:
+            hours, remainder = divmod(elapsed, 3600)
+            minutes, seconds = divmod(remainder, 60)
+            self._uptime_seconds = elapsed
+            self._uptime_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        
+        return self._uptime_str
+    
+    def _build_frame_snapshot(self) -> FrameSnapshot:
+        """Collect agent, task, message and metric state for one frame"""
+        system = self.system
+        
+        agents = tuple((name, agent.get_status()) for name, agent in system.agents.items())
+        active_agents = sum(1 for _, status in agents if status['is_alive'])
+        total_messages, total_errors = system.get_counter_totals()
+        
+        supervisor = system.supervisor
+        active_tasks = supervisor.get_all_tasks()
+        
+        return FrameSnapshot(
+            agents=agents,
+            # Copy in one C-level call before slicing: agent threads keep
+            # adding/removing tasks, and stepping through the live dict can
+            # raise "dictionary changed size during iteration"
+            tasks=tuple(active_tasks.items())[:5],
+            messages=system.get_recent_messages_view(),
+            totals=(active_agents, len(agents), system.pending_message_count(),
+                    len(active_tasks), len(supervisor.completed_tasks),
+                    total_messages, total_errors)
+        )
     
     def draw_header(self):
         """Draw monitor header"""
-        print("=" * 80)
-        print("🤖 MULTI-AGENT SYSTEM - REAL-TIME MONITOR".center(80))
-        print(f"Uptime: {self.format_uptime()}".center(80))
-        print("=" * 80)
-        print()
+        self._out.write(_BAR_EQ_N)
+        print("🤖 MULTI-AGENT SYSTEM - REAL-TIME MONITOR".center(80), file=self._out)
+        print(f"Uptime: {self.format_uptime()}".center(80), file=self._out)
+        self._out.write(_BAR_EQ_N)
+        print(file=self._out)
 
     
-    def draw_agent_status(self):
+    def draw_agent_status(self, snap: FrameSnapshot):
         """Draw agent status table"""
-        print("📊 AGENT STATUS")
-        print("-" * 80)
+        print("📊 AGENT STATUS", file=self._out)
+        self._out.write(_BAR_DASH_N)
         
         # Header
-        print(f"{'Agent':<20} {'State':<12} {'Messages':<10} {'Errors':<8} {'Alive':<8}")
-        print("-" * 80)
+        print(f"{'Agent':<20} {'State':<12} {'Messages':<10} {'Errors':<8} {'Alive':<8}", file=self._out)
+        self._out.write(_BAR_DASH_N)
         
         # Agents
-        for name, agent in self.system.agents.items():
-            status = agent.get_status()
+        for name, agent_status in snap.agents:
+            state = agent_status['state']
+            key = (state, agent_status['messages_processed'],
+                   agent_status['error_count'], agent_status['is_alive'])
+            
+            # Reuse the row rendered last frame if nothing changed
+            prev = self._prev_row.get(name)
+            if prev is not None and prev[0] == key:
+                print(prev[1], file=self._out)
+                continue
+            
+            name_col = self._name_cols.get(name)
+            if name_col is None:
+                name_col = self._name_cols[name] = f"{name:<20} "
             
             # Color code state
-            state = status['state']
-            if state == 'idle':
-                state_display = f"🟢 {state}"
-            elif state == 'processing':
-                state_display = f"🟡 {state}"
-            elif state == 'error':
-                state_display = f"🔴 {state}"
-            else:
-                state_display = f"⚪ {state}"
+            state_col = _STATE_COL.get(state) or f"{_STATE_DEFAULT + ' ' + state:<20} "
             
-            alive = "✅" if status['is_alive'] else "❌"
+            alive = "✅" if agent_status['is_alive'] else "❌"
             
-            print(f"{name:<20} {state_display:<20} {status['messages_processed']:<10} "
-                  f"{status['error_count']:<8} {alive:<8}")
+            line = (name_col + state_col + f"{agent_status['messages_processed']:<10} "
+                    f"{agent_status['error_count']:<8} {alive:<8}")
+            self._prev_row[name] = (key, line)
+            print(line, file=self._out)
         
-        print()
+        print(file=self._out)
 
     
-    def draw_task_queue(self):
+    def draw_task_queue(self, snap: FrameSnapshot):
         """Draw active tasks"""
-        print("📋 ACTIVE TASKS")
-        print("-" * 80)
+        print("📋 ACTIVE TASKS", file=self._out)
+        self._out.write(_BAR_DASH_N)
         
-        active_tasks = self.system.supervisor.get_all_tasks()
-        
-        if not active_tasks:
-            print("No active tasks")
+        if not snap.tasks:
+            print("No active tasks", file=self._out)
         else:
-            for task_id, task in list(active_tasks.items())[:5]:  # Show top 5
+            for task_id, task in snap.tasks:  # Top 5
                 task_type = task.get('task_type', 'unknown')
                 status = task.get('status', 'unknown')
                 assigned = len(task.get('assigned_agents', []))
                 responses = len(task.get('responses_received', {}))
                 
                 print(f"  [{task_id}] {task_type:<20} Status: {status:<10} "
-                      f"Agents: {assigned} Responses: {responses}")
+                      f"Agents: {assigned} Responses: {responses}", file=self._out)
         
-        print()
+        print(file=self._out)
 
 
-    def draw_message_flow(self):
+    def draw_message_flow(self, snap: FrameSnapshot):
         """Draw recent message activity"""
-        print("📨 MESSAGE FLOW (Last 10)")
-        print("-" * 80)
+        print("📨 MESSAGE FLOW (Last 10)", file=self._out)
+        self._out.write(_BAR_DASH_N)
         
-        history = self.system.get_message_history(limit=10)
-        
-        if not history:
-            print("No messages yet")
+        if not snap.messages:
+            print("No messages yet", file=self._out)
         else:
-            for msg in reversed(history):  # Most recent first
-                timestamp = msg['timestamp'].split('T')[1].split('.')[0]  # Just time
-                sender = msg['sender'][:12]
-                recipient = msg['recipient'][:12]
-                msg_type = msg['type']
-                
+            for timestamp, sender, recipient, msg_type in snap.messages:  # Most recent first
                 # Icon for message type
-                if msg_type == 'request':
-                    icon = "📤"
-                elif msg_type == 'response':
-                    icon = "📥"
-                elif msg_type == 'error':
-                    icon = "⚠️"
-                else:
-                    icon = "📨"
+                icon = _MSG_ICON.get(msg_type, _MSG_ICON_DEFAULT)
                 
-                print(f"  {timestamp} {icon} {sender:<12} → {recipient:<12} : {msg_type}")
+                print(f"  {timestamp} {icon} {sender:<12} → {recipient:<12} : {msg_type}", file=self._out)
         
-        print()
+        print(file=self._out)
     
-    def draw_system_metrics(self):
+    def draw_system_metrics(self, snap: FrameSnapshot):
         """Draw system-wide metrics"""
-        print("📈 SYSTEM METRICS")
-        print("-" * 80)
-        
-        status = self.system.get_system_status()
+        print("📈 SYSTEM METRICS", file=self._out)
+        self._out.write(_BAR_DASH_N)
         
-        total_agents = len(status['agents'])
-        active_agents = sum(1 for a in status['agents'].values() if a['is_alive'])
-        queue_size = status['message_queue_size']
-        active_tasks = status['active_tasks']
-        completed_tasks = status['completed_tasks']
+        key = snap.totals
         
-        # Calculate total messages processed
-        total_messages = sum(a['messages_processed'] for a in status['agents'].values())
-        total_errors = sum(a['error_count'] for a in status['agents'].values())
+        # Re-render the block only when a metric changed
+        if key != self._prev_metrics[0]:
+            (active_agents, total_agents, queue_size, active_tasks,
+             completed_tasks, total_messages, total_errors) = key
+            block = (f"  Agents: {active_agents}/{total_agents} active\n"
+                     f"  Message Queue: {queue_size} pending\n"
+                     f"  Tasks: {active_tasks} active, {completed_tasks} completed\n"
+                     f"  Messages Processed: {total_messages}\n"
+                     f"  Errors: {total_errors}\n")
+            self._prev_metrics = (key, block)
         
-        print(f"  Agents: {active_agents}/{total_agents} active")
-        print(f"  Message Queue: {queue_size} pending")
-        print(f"  Tasks: {active_tasks} active, {completed_tasks} completed")
-        print(f"  Messages Processed: {total_messages}")
-        print(f"  Errors: {total_errors}")
-        print()
+        self._out.write(self._prev_metrics[1])
+        print(file=self._out)
     
 
     def draw_footer(self):
         """Draw footer with controls"""
-        print("=" * 80)
-        print("Press Ctrl+C to stop monitoring".center(80))
-        print("=" * 80)
+        self._out.write(_BAR_EQ_N)
+        print("Press Ctrl+C to stop monitoring".center(80), file=self._out)
+        self._out.write(_BAR_EQ_N)
     
 
     def display(self):
         """Display full monitor view"""
-        self.clear_screen()
+        snap = self.cache.get_or_build(
+            ttl=self.refresh_rate,
+            mutation_counter=self.system.mutation_counter
+        )
+
+        self._out = io.StringIO()
         self.draw_header()
-        self.draw_agent_status()
-        self.draw_task_queue()
-        self.draw_message_flow()
-        self.draw_system_metrics()
+        self.draw_agent_status(snap)
+        self.draw_task_queue(snap)
+        self.draw_message_flow(snap)
+        self.draw_system_metrics(snap)
         self.draw_footer()
+
+        # Clear and write the whole frame at once
+        self.clear_screen()
+        sys.stdout.write(self._out.getvalue())
+        sys.stdout.flush()
     
-    def run(self, refresh_rate: float = 1.0):
-        """Run monitoring loop"""
+    async def run(self, refresh_rate: float = 1.0):
+        """
+        Run monitoring loop
+
+        Redraws as soon as the system reports a change, coalescing bursts so
+        that at most one frame is drawn per refresh_rate. With no changes the
+        view still refreshes every refresh_rate to keep the uptime ticking.
+        """
+        self.refresh_rate = refresh_rate
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+
+        def on_change():
+            # Called from agent threads
+            try:
+                loop.call_soon_threadsafe(changed.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+        self.system.add_change_listener(on_change)
         try:
+            self.display()
+            last_render = time.monotonic()
+
             while True:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=refresh_rate)
+                except asyncio.TimeoutError:
+                    pass
+
+                # Coalesce changes arriving faster than the refresh rate
+                delta = time.monotonic() - last_render
+                if delta < refresh_rate:
+                    await asyncio.sleep(refresh_rate - delta)
+
+                changed.clear()
                 self.display()
-                time.sleep(refresh_rate)
+                last_render = time.monotonic()
+        finally:
+            self.system.remove_change_listener(on_change)
+
+    def start(self, refresh_rate: float = 1.0):
+        """Run the monitoring loop until Ctrl+C"""
+        try:
+            run_async(self.run(refresh_rate))
         except KeyboardInterrupt:
             print("\n\n✅ Monitoring stopped")
 
@@ -206,7 +383,7 @@ def demo_monitor():
     monitor = SystemMonitor(system)
     
     try:
-        monitor.run(refresh_rate=1.0)
+        monitor.start(refresh_rate=1.0)
     except KeyboardInterrupt:
         pass
     finally:
@@ -218,12 +395,114 @@ def demo_monitor():
 
 # ==================== INTERACTIVE DEMO ====================
 
+_HELP = """Available commands:
+  task <type>    - Submit a task
+  status         - Show system status
+  messages       - Show message history
+  agents         - Show agent details
+  monitor        - Start live monitor
+  help           - Show this help
+  quit           - Stop system and exit
+
+"""
+
+
+def _write_block(text: str):
+    """Write a block of static text in one go"""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def _cmd_task(system: MultiAgentSystem, cmd: str, args: str):
+    """task <type> - Submit a task"""
+    parts = args.split()
+    task_type = parts[0] if parts else 'generic_task'
+    
+    task_id = system.submit_task(
+        task_type=task_type,
+        data={'user_input': cmd}
+    )
+    print(f"✅ Task submitted: {task_id}")
+    print()
+
+
+def _cmd_status(system: MultiAgentSystem, cmd: str, args: str):
+    """status - Show system status"""
+    status = system.get_system_status()
+    print("\n📊 System Status:")
+    print(format_json(status))
+    print()
+
+
+def _cmd_messages(system: MultiAgentSystem, cmd: str, args: str):
+    """messages - Show message history"""
+    history = system.get_message_history(20)
+    print("\n📨 Recent Messages:")
+    for msg in history[-10:]:  # Last 10
+        print(f"  {msg['sender']:12} → {msg['recipient']:12} : {msg['type']}")
+    print()
+
+
+def _cmd_agents(system: MultiAgentSystem, cmd: str, args: str):
+    """agents - Show agent details"""
+    print("\n🤖 Agent Details:")
+    for name, agent in system.agents.items():
+        status = agent.get_status()
+        print(f"\n  {name}:")
+        print(f"    Role: {status['role']}")
+        print(f"    State: {status['state']}")
+        print(f"    Messages: {status['messages_processed']}")
+        print(f"    Errors: {status['error_count']}")
+    print()
+
+
+def _cmd_monitor(system: MultiAgentSystem, cmd: str, args: str):
+    """monitor - Start live monitor"""
+    print("\n▶️ Starting live monitor (Ctrl+C to stop)...")
+    time.sleep(1)
+    monitor = SystemMonitor(system)
+    try:
+        monitor.start(refresh_rate=1.0)
+    except KeyboardInterrupt:
+        print("\n✅ Monitor stopped")
+        print()
+
+
+def _cmd_help(system: MultiAgentSystem, cmd: str, args: str):
+    """help - Show this help"""
+    _write_block("\n" + _HELP)
+
+
+def _cmd_quit(system: MultiAgentSystem, cmd: str, args: str) -> bool:
+    """quit - Stop system and exit"""
+    print("\n🛑 Shutting down...")
+    return True
+
+
+def _cmd_unknown(system: MultiAgentSystem, cmd: str, args: str):
+    print(f"❌ Unknown command: {cmd}")
+    print("   Type 'help' for available commands")
+    print()
+
+
+# Command name -> handler(system, cmd, args); a truthy return ends the session
+_COMMANDS = {
+    'task': _cmd_task,
+    'status': _cmd_status,
+    'messages': _cmd_messages,
+    'agents': _cmd_agents,
+    'monitor': _cmd_monitor,
+    'help': _cmd_help,
+    'quit': _cmd_quit
+}
+
+
 def interactive_demo():
     """Interactive demo with user commands"""
     
-    print("="*60)
+    print(_BAR_EQ_60)
     print("🤖 MULTI-AGENT SYSTEM - INTERACTIVE DEMO")
-    print("="*60)
+    print(_BAR_EQ_60)
     print()
     
     # Initialize system
@@ -233,85 +512,19 @@ def interactive_demo():
 
     print("✅ System started!")
     print()
-    print("Available commands:")
-    print("  task <type>    - Submit a task")
-    print("  status         - Show system status")
-    print("  messages       - Show message history")
-    print("  agents         - Show agent details")
-    print("  monitor        - Start live monitor")
-    print("  help           - Show this help")
-    print("  quit           - Stop system and exit")
-    print()
+    _write_block(_HELP)
     
 
     try:
         while True:
             cmd = input(">>> ").strip().lower()
+            if not cmd:
+                continue
             
-            if cmd.startswith('task'):
-                parts = cmd.split()
-                task_type = parts[1] if len(parts) > 1 else 'generic_task'
-                
-                task_id = system.submit_task(
-                    task_type=task_type,
-                    data={'user_input': cmd}
-                )
-                print(f"✅ Task submitted: {task_id}")
-                print()
-            
-            elif cmd == 'status':
-                status = system.get_system_status()
-                print("\n📊 System Status:")
-                print(json.dumps(status, indent=2))
-                print()
-            
-            elif cmd == 'messages':
-                history = system.get_message_history(20)
-                print("\n📨 Recent Messages:")
-                for msg in history[-10:]:  # Last 10
-                    print(f"  {msg['sender']:12} → {msg['recipient']:12} : {msg['type']}")
-                print()
-            
-            elif cmd == 'agents':
-                print("\n🤖 Agent Details:")
-                for name, agent in system.agents.items():
-                    status = agent.get_status()
-                    print(f"\n  {name}:")
-                    print(f"    Role: {status['role']}")
-                    print(f"    State: {status['state']}")
-                    print(f"    Messages: {status['messages_processed']}")
-                    print(f"    Errors: {status['error_count']}")
-                print()
-            
-            elif cmd == 'monitor':
-                print("\n▶️ Starting live monitor (Ctrl+C to stop)...")
-                time.sleep(1)
-                monitor = SystemMonitor(system)
-                try:
-                    monitor.run(refresh_rate=1.0)
-                except KeyboardInterrupt:
-                    print("\n✅ Monitor stopped")
-                    print()
-            
-            elif cmd == 'help':
-                print("\nAvailable commands:")
-                print("  task <type>    - Submit a task")
-                print("  status         - Show system status")
-                print("  messages       - Show message history")
-                print("  agents         - Show agent details")
-                print("  monitor        - Start live monitor")
-                print("  help           - Show this help")
-                print("  quit           - Stop system and exit")
-                print()
-            
-            elif cmd == 'quit':
-                print("\n🛑 Shutting down...")
+            name, _, args = cmd.partition(' ')
+            handler = _COMMANDS.get(name, _cmd_unknown)
+            if handler(system, cmd, args):
                 break
-            
-            else:
-                print(f"❌ Unknown command: {cmd}")
-                print("   Type 'help' for available commands")
-                print()
     
     except KeyboardInterrupt:
         print("\n\n⚠️ Interrupted")
@@ -325,12 +538,34 @@ def interactive_demo():
 
 # ==================== STRESS TEST ====================
 
+async def submit_tasks_concurrently(system: MultiAgentSystem, task_type: str,
+                                    num_tasks: int, max_concurrency: int = 10):
+    """Submit num_tasks tasks from worker threads, at most max_concurrency at a time"""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    submitted = 0
+
+    async def submit(i: int):
+        nonlocal submitted
+        async with semaphore:
+            await asyncio.to_thread(
+                system.submit_task,
+                task_type=task_type,
+                data={'task_number': i}
+            )
+        
+        submitted += 1
+        if submitted % 20 == 0:
+            print(f"   Submitted {submitted}/{num_tasks} tasks...")
+
+    await asyncio.gather(*(submit(i) for i in range(num_tasks)))
+
+
 def stress_test():
     """Stress test the system with high load"""
     
-    print("="*60)
+    print(_BAR_EQ_60)
     print("🔥 MULTI-AGENT SYSTEM - STRESS TEST")
-    print("="*60)
+    print(_BAR_EQ_60)
     print()
     
     system = MultiAgentSystem()
@@ -368,14 +603,7 @@ def stress_test():
     
     start_time = time.time()
     
-    for i in range(num_tasks):
-        system.submit_task(
-            task_type='stress_test',
-            data={'task_number': i}
-        )
-        
-        if (i + 1) % 20 == 0:
-            print(f"   Submitted {i + 1}/{num_tasks} tasks...")
+    run_async(submit_tasks_concurrently(system, 'stress_test', num_tasks))
     
     submit_duration = time.time() - start_time
     
@@ -392,8 +620,7 @@ def stress_test():
     print("\n📊 Stress Test Results:")
     status = system.get_system_status()
     
-    total_messages = sum(a['messages_processed'] for a in status['agents'].values())
-    total_errors = sum(a['error_count'] for a in status['agents'].values())
+    total_messages, total_errors = system.get_counter_totals()
     
     print(f"  Total messages processed: {total_messages}")
     print(f"  Total errors: {total_errors}")
@@ -415,22 +642,26 @@ def stress_test():
 
 # ==================== MAIN MENU ====================
 
+_MENU = f"""{_BAR_EQ_60}
+🤖 MULTI-AGENT SYSTEM - PHASE 1 DEMOS
+{_BAR_EQ_60}
+
+Choose a demo:
+
+  1. Basic Demo           - Simple task submission
+  2. Live Monitor         - Real-time system monitoring
+  3. Interactive Demo     - Command-line interface
+  4. Stress Test          - High-load performance test
+  5. Run Tests            - Execute test suite
+  6. Exit
+
+"""
+
+
 def main_menu():
     """Main menu for choosing demos"""
     
-    print("="*60)
-    print("🤖 MULTI-AGENT SYSTEM - PHASE 1 DEMOS")
-    print("="*60)
-    print()
-    print("Choose a demo:")
-    print()
-    print("  1. Basic Demo           - Simple task submission")
-    print("  2. Live Monitor         - Real-time system monitoring")
-    print("  3. Interactive Demo     - Command-line interface")
-    print("  4. Stress Test          - High-load performance test")
-    print("  5. Run Tests            - Execute test suite")
-    print("  6. Exit")
-    print()
+    _write_block(_MENU)
     
     while True:
         choice = input("Enter choice (1-6): ").strip()
@@ -3,18 +3,37 @@ setup_enhancements.py
 Setup and verify all optional enhancements
 """
 
+import importlib
 import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 
+_BAR = "=" * 70
+
 def print_header():
-    print("="*70)
+    print(_BAR)
     print("🎨 ENHANCEMENTS SETUP - All 4 Features")
-    print("="*70)
+    print(_BAR)
     print()
 
 
+def _present_files(root='.', subdirs=('agents',)):
+    """Names of entries in root plus 'subdir/name' entries of the given subdirs"""
+    present = set()
+    with os.scandir(root) as entries:
+        present.update(entry.name for entry in entries)
+    
+    for subdir in subdirs:
+        path = os.path.join(root, subdir)
+        if os.path.isdir(path):
+            with os.scandir(path) as entries:
+                present.update(f"{subdir}/{entry.name}" for entry in entries)
+    
+    return present
+
+
 def check_phase3():
     """Check if Phase 3 is set up"""
     print("🔍 Checking Phase 3 system...")
@@ -25,9 +44,11 @@ def check_phase3():
         'agents/writer_agent.py'
     ]
     
+    present = _present_files()
+    
     missing = []
     for file in required_files:
-        if os.path.exists(file):
+        if file in present:
             print(f"   ✅ {file}")
         else:
             print(f"   ❌ {file} - MISSING")
@@ -53,9 +74,11 @@ def check_enhancement_files():
         'feedback_loop.py': 'Enhancement 4: Feedback Loop'
     }
     
+    present = _present_files(subdirs=())
+    
     missing = []
     for file, description in enhancement_files.items():
-        if os.path.exists(file):
+        if file in present:
             print(f"   ✅ {file} ({description})")
         else:
             print(f"   ❌ {file} - MISSING")
@@ -86,19 +109,25 @@ def install_dependencies():
             'reportlab==4.2.0'
         ]
         
-        for package in packages:
-            print(f"\n   Installing {package}...")
-            try:
-                subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
+        # One pip run resolves and downloads everything in a single pass
+        print(f"\n   Installing {', '.join(packages)}...")
+        try:
+            subprocess.check_call([
+                sys.executable, '-m', 'pip', 'install',
+                '--disable-pip-version-check', '--no-input',
+                *packages
+            ])
+            for package in packages:
                 print(f"   ✅ {package} installed")
-            except subprocess.CalledProcessError as e:
-                print(f"   ❌ Failed to install {package}: {e}")
-                return False
+        except subprocess.CalledProcessError as e:
+            print(f"   ❌ Failed to install packages: {e}")
+            return False
     else:
         print("   Installing from requirements_enhancements.txt...")
         try:
             subprocess.check_call([
-                sys.executable, '-m', 'pip', 'install', 
+                sys.executable, '-m', 'pip', 'install',
+                '--disable-pip-version-check', '--no-input',
                 '-r', 'requirements_enhancements.txt'
             ])
             print("   ✅ All dependencies installed")
@@ -110,57 +139,52 @@ def install_dependencies():
     return True
 
 
+# (label, success message, failure message, [(module, attribute or None)])
+_IMPORT_TESTS = [
+    ("Enhancement 1: Gradio Web UI", "Gradio imports work", "Gradio import failed",
+     [('gradio', None), ('app_gradio', 'GradioApp')]),
+    ("Enhancement 2: Batch Processing", "Batch processor imports work", "Batch processor import failed",
+     [('batch_processor', 'BatchProcessor')]),
+    ("Enhancement 3: Export Formats", "Export tools import work", "Export import failed",
+     [('docx', 'Document'), ('reportlab', None), ('export_formats', 'ProposalExporter')]),
+    ("Enhancement 4: Feedback Loop", "Feedback system imports work", "Feedback import failed",
+     [('feedback_loop', 'FeedbackSystem')]),
+]
+
+
+def _try_imports(targets):
+    """Import each (module, attribute) pair; return the first error or None"""
+    try:
+        for module_name, attribute in targets:
+            module = importlib.import_module(module_name)
+            if attribute:
+                getattr(module, attribute)
+        return None
+    except Exception as e:
+        return e
+
+
 def test_imports():
     """Test if enhancements can be imported"""
     print("\n🧪 Testing imports...")
     
+    # Imports are independent, so overlap their file lookups and loads
+    with ThreadPoolExecutor(max_workers=len(_IMPORT_TESTS)) as executor:
+        errors = list(executor.map(_try_imports, [targets for *_, targets in _IMPORT_TESTS]))
+    
     tests_passed = 0
     tests_failed = 0
     
-    # Test Enhancement 1: Gradio
-    print("\n   Testing Enhancement 1: Gradio Web UI...")
-    try:
-        import gradio as gr
-        from app_gradio import GradioApp
-        print("   ✅ Gradio imports work")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Gradio import failed: {e}")
-        tests_failed += 1
-    
-    # Test Enhancement 2: Batch Processing
-    print("\n   Testing Enhancement 2: Batch Processing...")
-    try:
-        from batch_processor import BatchProcessor
-        print("   ✅ Batch processor imports work")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Batch processor import failed: {e}")
-        tests_failed += 1
-    
-    # Test Enhancement 3: Export
-    print("\n   Testing Enhancement 3: Export Formats...")
-    try:
-        from docx import Document
-        import reportlab
-        from export_formats import ProposalExporter
-        print("   ✅ Export tools import work")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Export import failed: {e}")
-        tests_failed += 1
-    
-    # Test Enhancement 4: Feedback
-    print("\n   Testing Enhancement 4: Feedback Loop...")
-    try:
-        from feedback_loop import FeedbackSystem
-        print("   ✅ Feedback system imports work")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Feedback import failed: {e}")
-        tests_failed += 1
+    for (label, ok_msg, fail_msg, _), error in zip(_IMPORT_TESTS, errors):
+        print(f"\n   Testing {label}...")
+        if error is None:
+            print(f"   ✅ {ok_msg}")
+            tests_passed += 1
+        else:
+            print(f"   ❌ {fail_msg}: {error}")
+            tests_failed += 1
     
-    print(f"\n   Tests: {tests_passed}/4 passed")
+    print(f"\n   Tests: {tests_passed}/{len(_IMPORT_TESTS)} passed")
     
     return tests_failed == 0
 
@@ -254,9 +278,9 @@ if __name__ == "__main__":
 
 def print_next_steps(all_checks_passed):
     """Print next steps"""
-    print("\n" + "="*70)
+    print("\n" + _BAR)
     print("📊 SETUP SUMMARY")
-    print("="*70)
+    print(_BAR)
     print()
     
     if all_checks_passed:
@@ -304,7 +328,7 @@ def print_next_steps(all_checks_passed):
         print("  - feedback_loop.py")
         print("  - requirements_enhancements.txt")
     
-    print("="*70)
+    print(_BAR)
 
 
 def main():
@@ -3,40 +3,102 @@ setup_phase3.py
 Automated setup for Phase 3
 """
 
+import functools
+import io
 import os
 import sys
+from contextlib import redirect_stdout
+from importlib.machinery import PathFinder
 
 
+# Directories the setup checks look into
+PROJECT_DIRS = ('.', 'tools', 'agents')
+
+# agents/__init__.py exporting all Phase 2 and Phase 3 agents
+_AGENTS_INIT_BYTES = '''"""
+agents package
+Specialized AI agents for the multi-agent system
+"""
+
+from .analyst_agent import AnalystAgent
+from .evaluator_agent import EvaluatorAgent
+from .innovator_agent import InnovatorAgent
+from .writer_agent import WriterAgent
+
+__all__ = ['AnalystAgent', 'EvaluatorAgent', 'InnovatorAgent', 'WriterAgent']
+'''.encode('utf-8')
+
+# Truncating write of raw bytes (O_BINARY keeps Windows from translating newlines)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _buffered(step):
+    """Collect everything a setup step prints and write it to stdout in one go"""
+    @functools.wraps(step)
+    def wrapper(*args, **kwargs):
+        out = io.StringIO()
+        try:
+            with redirect_stdout(out):
+                return step(*args, **kwargs)
+        finally:
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+    return wrapper
+
+
+@_buffered
 def print_header():
     print("="*70)
     print("🚀 PHASE 3 SETUP - Complete System")
     print("="*70)
     print()
 
-def check_phase2_files():
+def _scan_dir(directory):
+    """Map entry name -> os.DirEntry for a directory (empty if it doesn't exist)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _has_file(entries, name):
+    """True if the scanned entries contain a regular file called name"""
+    entry = entries.get(name)
+    # is_file() uses the type cached by scandir, no extra stat
+    return entry is not None and entry.is_file()
+
+
+def _scan_project():
+    """Scan the project directories once: directory -> {name: os.DirEntry}"""
+    return {directory: _scan_dir(directory) for directory in PROJECT_DIRS}
+
+
+@_buffered
+def check_phase2_files(inventory=None):
     """Check if Phase 2 is properly set up"""
     print("🔍 Checking Phase 2 files...")
     
-    required_files = {
-        'demo_phase1.py': '.',
-        'demo_phase2.py': '.',
-        'llm_wrapper.py': 'tools',
-        'pdf_reader.py': 'tools',
-        'analyst_agent.py': 'agents',
-        'evaluator_agent.py': 'agents',
-        '__init__.py (tools)': 'tools',
-        '__init__.py (agents)': 'agents'
-    }
+    if inventory is None:
+        inventory = _scan_project()
+    
+    required_files = [
+        ('demo_phase1.py', '.'),
+        ('demo_phase2.py', '.'),
+        ('llm_wrapper.py', 'tools'),
+        ('pdf_reader.py', 'tools'),
+        ('analyst_agent.py', 'agents'),
+        ('evaluator_agent.py', 'agents'),
+        ('__init__.py', 'tools'),
+        ('__init__.py', 'agents')
+    ]
     
     missing = []
     
-    for file_desc, directory in required_files.items():
-        if '__init__.py' in file_desc:
-            file_path = os.path.join(directory, '__init__.py')
-        else:
-            file_path = os.path.join(directory, file_desc) if directory != '.' else file_desc
+    for file_name, directory in required_files:
+        file_path = file_name if directory == '.' else os.path.join(directory, file_name)
         
-        if os.path.exists(file_path):
+        if _has_file(inventory.get(directory, {}), file_name):
             print(f"   ✅ {file_path}")
         else:
             print(f"   ❌ {file_path} - MISSING")
@@ -50,16 +112,19 @@ def check_phase2_files():
     print("\n✅ Phase 2 files present")
     return True
 
-def check_new_agent_files():
+@_buffered
+def check_new_agent_files(inventory=None):
     """Check if Phase 3 agent files exist"""
     print("\n🔍 Checking Phase 3 agent files...")
     
     new_agents = ['innovator_agent.py', 'writer_agent.py']
     
+    present = inventory['agents'] if inventory is not None else _scan_dir('agents')
+    
     all_exist = True
     for agent_file in new_agents:
         agent_path = os.path.join('agents', agent_file)
-        if os.path.exists(agent_path):
+        if _has_file(present, agent_file):
             print(f"   ✅ {agent_path}")
         else:
             print(f"   ❌ {agent_path} - MISSING")
@@ -72,39 +137,33 @@ def check_new_agent_files():
     
     print("\n✅ Phase 3 agent files present")
     return True
+@_buffered
 def update_agents_init():
     """Update agents/__init__.py to include new agents"""
     print("\n📝 Updating agents/__init__.py...")
     
     init_path = os.path.join('agents', '__init__.py')
     
-    new_content = '''"""
-agents package
-Specialized AI agents for the multi-agent system
-"""
-
-from .analyst_agent import AnalystAgent
-from .evaluator_agent import EvaluatorAgent
-from .innovator_agent import InnovatorAgent
-from .writer_agent import WriterAgent
-
-__all__ = ['AnalystAgent', 'EvaluatorAgent', 'InnovatorAgent', 'WriterAgent']
-'''
-    
     try:
-        with open(init_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+        fd = os.open(init_path, _WRITE_FLAGS, 0o644)
+        try:
+            os.write(fd, _AGENTS_INIT_BYTES)
+        finally:
+            os.close(fd)
         print(f"   ✅ Updated {init_path}")
         return True
     except Exception as e:
         print(f"   ❌ Failed to update: {e}")
         return False
 
-def check_demo_phase3():
+@_buffered
+def check_demo_phase3(inventory=None):
     """Check if demo_phase3.py exists"""
     print("\n🔍 Checking demo_phase3.py...")
     
-    if os.path.exists('demo_phase3.py'):
+    present = inventory['.'] if inventory is not None else _scan_dir('.')
+    
+    if _has_file(present, 'demo_phase3.py'):
         print("   ✅ demo_phase3.py exists")
         return True
     else:
@@ -113,47 +172,49 @@ def check_demo_phase3():
         return False
 
 
+def _module_available(module_name):
+    """Locate a module's source without importing it or its parent packages"""
+    path = None
+    name = ''
+    for part in module_name.split('.'):
+        name = f"{name}.{part}" if name else part
+        spec = PathFinder.find_spec(name, path)
+        if spec is None:
+            return False
+        path = spec.submodule_search_locations
+    return True
+
+
+def _check_modules(label, module_names):
+    """Report whether all modules of one phase can be found"""
+    missing = [name for name in module_names if not _module_available(name)]
+    if missing:
+        print(f"   ❌ {label} failed: module(s) not found: {', '.join(missing)}")
+        return False
+    print(f"   ✅ {label} imports")
+    return True
+
+
+@_buffered
 def test_imports():
     """Test if all imports work"""
     print("\n🧪 Testing imports...")
     
-    tests_passed = 0
-    tests_failed = 0
-    
-    # Test Phase 1
-    try:
-        from demo_phase1 import MultiAgentSystem
-        print("   ✅ Phase 1 imports")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Phase 1 failed: {e}")
-        tests_failed += 1
-    
-    # Test Phase 2
-    try:
-        from tools.llm_wrapper import LLMWrapper
-        from tools.pdf_reader import PDFReader
-        from agents.analyst_agent import AnalystAgent
-        from agents.evaluator_agent import EvaluatorAgent
-        print("   ✅ Phase 2 imports")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Phase 2 failed: {e}")
-        tests_failed += 1
+    phases = [
+        ('Phase 1', ['demo_phase1']),
+        ('Phase 2', ['tools.llm_wrapper', 'tools.pdf_reader',
+                     'agents.analyst_agent', 'agents.evaluator_agent']),
+        ('Phase 3', ['agents.innovator_agent', 'agents.writer_agent'])
+    ]
     
-    # Test Phase 3
-    try:
-        from agents.innovator_agent import InnovatorAgent
-        from agents.writer_agent import WriterAgent
-        print("   ✅ Phase 3 imports")
-        tests_passed += 1
-    except Exception as e:
-        print(f"   ❌ Phase 3 failed: {e}")
-        tests_failed += 1
+    results = [_check_modules(label, modules) for label, modules in phases]
+    tests_passed = sum(results)
+    tests_failed = len(results) - tests_passed
     
     return tests_passed, tests_failed
 
 
+@_buffered
 def create_quick_test():
     """Create a quick test script"""
     print("\n📝 Creating quick test script...")
@@ -163,10 +224,12 @@ test_phase3.py
 Quick test for Phase 3 system
 """
 
-from agents.innovator_agent import InnovatorAgent
-from agents.writer_agent import WriterAgent
-from tools.llm_wrapper import LLMWrapper
-from demo_phase1 import MessageQueue
+from tools.import_utils import cached_import
+
+InnovatorAgent = cached_import('agents.innovator_agent', 'InnovatorAgent')
+WriterAgent = cached_import('agents.writer_agent', 'WriterAgent')
+LLMWrapper = cached_import('tools.llm_wrapper', 'LLMWrapper')
+MessageQueue = cached_import('demo_phase1', 'MessageQueue')
 
 print("Testing Phase 3 agents...")
 
@@ -203,6 +266,7 @@ print("\\nNext: Run 'python demo_phase3.py'")
         print(f"   ❌ Failed: {e}")
         return False
 
+@_buffered
 def print_next_steps(all_checks_passed):
     """Print next steps"""
     print("\n" + "="*70)
@@ -237,7 +301,7 @@ def main():
     print_header()
     
     # Check we're in right directory
-    if not os.path.exists('demo_phase1.py'):
+    if not os.path.lexists('demo_phase1.py'):
         print("❌ Error: demo_phase1.py not found!")
         print("   Run this script from the project root directory")
         return False
@@ -245,11 +309,12 @@ def main():
     print("✅ Running from project root")
     print()
     
-    # Run checks
+    # Run checks against a single scan of the project
+    inventory = _scan_project()
     checks = {
-        'Phase 2 Files': check_phase2_files(),
-        'Phase 3 Agent Files': check_new_agent_files(),
-        'demo_phase3.py': check_demo_phase3()
+        'Phase 2 Files': check_phase2_files(inventory),
+        'Phase 3 Agent Files': check_new_agent_files(inventory),
+        'demo_phase3.py': check_demo_phase3(inventory)
     }
     
     # Update init file if agents exist
@@ -6,11 +6,10 @@
 
 """
 
-from groq import Groq
 import os
-from dotenv import load_dotenv
 
 # Load API Key
+from dotenv import load_dotenv
 load_dotenv()
 api_key = os.getenv("GROQ_API_KEY")
 
@@ -22,7 +21,8 @@ print("✅ API key loaded")
 print(f"Key starts with: {api_key[:10]}...")
 
 
-# Initialize client
+# Initialize client (groq is only imported once a key is known to exist)
+from groq import Groq
 client = Groq(api_key=api_key)
 print("✅ Groq client initialized")
 
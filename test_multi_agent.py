@@ -3,8 +3,14 @@ Multi-Agent System - Test Suite
 Comprehensive tests for Phase 1 components
 """
 
+import io
+import random
+import sys
 import unittest
+from collections import deque
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from demo_phase1 import (
     Message, MessageType, Priority, MessageQueue,
@@ -15,12 +21,25 @@ from demo_phase1 import (
 
 # ==================== TEST AGENTS ====================
 
-class DummyAgent(BaseAgent):
+class SignalingAgent(BaseAgent):
+    """Base test agent that signals each time a message is fully processed"""
+    
+    def __init__(self, name: str, role: str, message_queue: MessageQueue):
+        super().__init__(name, role, message_queue)
+        self._idle_after_process = threading.Event()
+    
+    def log_processing(self, message: Message, result, success: bool = True):
+        """Log, then signal that a message has been fully processed"""
+        super().log_processing(message, result, success)
+        self._idle_after_process.set()
+
+
+class DummyAgent(SignalingAgent):
     """Simple test agent for testing"""
     
-    def __init__(self, name: str, message_queue: MessageQueue):
+    def __init__(self, name: str, message_queue: MessageQueue, max_messages=None):
         super().__init__(name, "Test Agent", message_queue)
-        self.processed_messages = []
+        self.processed_messages = deque(maxlen=max_messages)
     
     def process(self, message: Message):
         """Just log the message"""
@@ -33,7 +52,7 @@ class DummyAgent(BaseAgent):
 
 
 
-class EchoAgent(BaseAgent):
+class EchoAgent(SignalingAgent):
     """Agent that echoes back messages"""
     
     def __init__(self, name: str, message_queue: MessageQueue):
@@ -48,62 +67,72 @@ class EchoAgent(BaseAgent):
 
 
 
+def wait_until(condition, timeout: float = 2.0, interval: float = 0.01) -> bool:
+    """Poll condition until it is truthy or timeout expires"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+
 # ==================== MESSAGE TESTS ====================
 
 class TestMessage(unittest.TestCase):
     """Test Message class"""
     
-    def test_message_creation(self):
-        """Test creating a message"""
-        msg = Message(
-            sender="agent1",
-            recipient="agent2",
-            message_type=MessageType.REQUEST,
-            content={'data': 'test'}
-        )
-        
-        self.assertEqual(msg.sender, "agent1")
-        self.assertEqual(msg.recipient, "agent2")
-        self.assertEqual(msg.message_type, MessageType.REQUEST)
-        self.assertIsInstance(msg.timestamp, datetime)
-        self.assertIsNotNone(msg.message_id)
-
-    
-    def test_message_priority(self):
-        """Test message priority"""
-        msg_low = Message(
-            sender="a", recipient="b",
-            message_type=MessageType.REQUEST,
-            content={},
-            priority=Priority.LOW
-        )
-        
-        msg_urgent = Message(
-            sender="a", recipient="b",
-            message_type=MessageType.REQUEST,
-            content={},
-            priority=Priority.URGENT
-        )
-        
-        self.assertEqual(msg_low.priority, Priority.LOW)
-        self.assertEqual(msg_urgent.priority, Priority.URGENT)
-    
-
-    def test_message_serialization(self):
-        """Test message to_dict"""
-        msg = Message(
-            sender="test",
-            recipient="receiver",
-            message_type=MessageType.RESPONSE,
-            content={'result': 42}
-        )
+    def test_message(self):
+        """Test message creation, priority and to_dict"""
+        request = MessageType.REQUEST
+        low, urgent = Priority.LOW, Priority.URGENT
         
-        msg_dict = msg.to_dict()
+        with self.subTest(case='creation'):
+            msg = Message(
+                sender="agent1",
+                recipient="agent2",
+                message_type=request,
+                content={'data': 'test'}
+            )
+            
+            self.assertEqual(msg.sender, "agent1")
+            self.assertEqual(msg.recipient, "agent2")
+            self.assertEqual(msg.message_type, request)
+            self.assertIsInstance(msg.timestamp, datetime)
+            self.assertIsNotNone(msg.message_id)
+        
+        with self.subTest(case='priority'):
+            msg_low = Message(
+                sender="a", recipient="b",
+                message_type=request,
+                content={},
+                priority=low
+            )
+            
+            msg_urgent = Message(
+                sender="a", recipient="b",
+                message_type=request,
+                content={},
+                priority=urgent
+            )
+            
+            self.assertEqual(msg_low.priority, low)
+            self.assertEqual(msg_urgent.priority, urgent)
         
-        self.assertIn('sender', msg_dict)
-        self.assertIn('recipient', msg_dict)
-        self.assertIn('content', msg_dict)
-        self.assertEqual(msg_dict['content']['result'], 42)
+        with self.subTest(case='serialization'):
+            msg = Message(
+                sender="test",
+                recipient="receiver",
+                message_type=MessageType.RESPONSE,
+                content={'result': 42}
+            )
+            
+            msg_dict = msg.to_dict()
+            
+            self.assertIn('sender', msg_dict)
+            self.assertIn('recipient', msg_dict)
+            self.assertIn('content', msg_dict)
+            self.assertEqual(msg_dict['content']['result'], 42)
     
 
 class TestMessageQueue(unittest.TestCase):
@@ -131,28 +160,31 @@ class TestMessageQueue(unittest.TestCase):
     
 
     def test_priority_ordering(self):
-        """Test that high priority messages come first"""
-        # Send low priority first
-        msg_low = Message(
-            sender="s", recipient="r",
-            message_type=MessageType.REQUEST,
-            content={'priority': 'low'},
-            priority=Priority.LOW
-        )
-        self.queue.send(msg_low)
-        
-        # Then send urgent
-        msg_urgent = Message(
-            sender="s", recipient="r",
-            message_type=MessageType.REQUEST,
-            content={'priority': 'urgent'},
-            priority=Priority.URGENT
-        )
-        self.queue.send(msg_urgent)
-        
-        # Urgent should come out first
-        first = self.queue.receive("r", timeout=1)
-        self.assertEqual(first.content['priority'], 'urgent')
+        """Test that higher priority messages come first, FIFO within a priority"""
+        rng = random.Random(1234)
+        priorities = list(Priority)
+        sequences = [priorities, priorities[::-1]] + [
+            [rng.choice(priorities) for _ in range(rng.randint(2, 20))]
+            for _ in range(20)
+        ]
+        
+        for sequence in sequences:
+            with self.subTest(priorities=[p.name for p in sequence]):
+                self.queue.send_many([
+                    Message(
+                        sender="s", recipient="r",
+                        message_type=MessageType.REQUEST,
+                        content={'index': i},
+                        priority=priority
+                    )
+                    for i, priority in enumerate(sequence)
+                ])
+                
+                received = [self.queue.receive("r", timeout=1) for _ in sequence]
+                # Stable sort keeps send order among equal priorities
+                expected = sorted(range(len(sequence)),
+                                  key=lambda i: -sequence[i].value)
+                self.assertEqual([msg.content['index'] for msg in received], expected)
     
 
     def test_broadcast(self):
@@ -174,6 +206,24 @@ class TestMessageQueue(unittest.TestCase):
             self.assertEqual(received.content['broadcast'], 'message')
     
 
+    def test_send_many(self):
+        """Test batched sending delivers every message in order"""
+        messages = [
+            Message(
+                sender="sender",
+                recipient="receiver",
+                message_type=MessageType.REQUEST,
+                content={'index': i}
+            )
+            for i in range(10)
+        ]
+        self.queue.send_many(messages, batch_size=3)
+        
+        for i in range(10):
+            received = self.queue.receive("receiver", timeout=1)
+            self.assertEqual(received.content['index'], i)
+        self.assertEqual(len(self.queue.get_history(limit=20)), 10)
+    
     def test_message_history(self):
         """Test message history tracking"""
         for i in range(5):
@@ -242,7 +292,6 @@ class TestBaseAgent(unittest.TestCase):
     def test_agent_threading(self):
         """Test agent runs in thread"""
         self.agent.start()
-        time.sleep(0.5)
         
         # Agent should be alive
         self.assertTrue(self.agent._thread.is_alive())
@@ -257,14 +306,13 @@ class TestBaseAgent(unittest.TestCase):
         self.queue.send(msg)
         
         # Wait for processing
-        time.sleep(0.5)
+        self.assertTrue(self.agent._idle_after_process.wait(timeout=2.0))
         
         # Check it was processed
         self.assertGreater(len(self.agent.processed_messages), 0)
         
-        # Stop agent
+        # Stop agent (stop() joins the thread)
         self.agent.stop()
-        time.sleep(0.5)
         self.assertEqual(self.agent.state, AgentState.STOPPED)
     
 
@@ -398,15 +446,13 @@ class TestMultiAgentSystem(unittest.TestCase):
         
         # Start all
         self.system.start_all_agents()
-        time.sleep(0.5)
         
         # Check they're running
         for agent in self.system.agents.values():
             self.assertTrue(agent._thread.is_alive())
         
-        # Stop all
+        # Stop all (stop() joins each thread)
         self.system.stop_all_agents()
-        time.sleep(0.5)
         
         # Check they stopped
         for agent in self.system.agents.values():
@@ -415,7 +461,6 @@ class TestMultiAgentSystem(unittest.TestCase):
     def test_submit_task(self):
         """Test submitting a task"""
         self.system.start_all_agents()
-        time.sleep(0.5)
         
         task_id = self.system.submit_task(
             task_type='test_task',
@@ -423,7 +468,7 @@ class TestMultiAgentSystem(unittest.TestCase):
         )
         
         self.assertIsNotNone(task_id)
-        time.sleep(0.5)
+        wait_until(lambda: self.system.supervisor.active_tasks)
         
         # Check supervisor received it
         self.assertGreater(len(self.system.supervisor.active_tasks), 0)
@@ -472,7 +517,6 @@ class TestAgentCommunication(unittest.TestCase):
         # Start agents
         self.agent1.start()
         self.agent2.start()
-        time.sleep(0.5)
 
            # Agent 1 sends to Agent 2
         self.agent1.send_message(
@@ -482,7 +526,7 @@ class TestAgentCommunication(unittest.TestCase):
             requires_response=True
         )
         
-        time.sleep(0.5)
+        self.assertTrue(self.agent2._idle_after_process.wait(timeout=2.0))
         
         # Check agent2 processed it
         self.assertGreater(len(self.agent2.processing_history), 0)
@@ -508,15 +552,18 @@ class TestPerformance(unittest.TestCase):
         start_time = time.time()
         num_messages = 1000
         
-        for i in range(num_messages):
-            msg = Message(
+        messages = [
+            Message(
                 sender="sender",
                 recipient="receiver",
                 message_type=MessageType.REQUEST,
                 content={'index': i}
             )
-            queue.send(msg)
+            for i in range(num_messages)
+        ]
+        queue.send_many(messages)
         
+        self.assertEqual(len(queue.get_history(limit=num_messages)), num_messages)
         elapsed = time.time() - start_time
         throughput = num_messages / elapsed
         
@@ -527,9 +574,8 @@ class TestPerformance(unittest.TestCase):
     def test_agent_response_time(self):
         """Test agent processing latency"""
         queue = MessageQueue()
-        agent = DummyAgent("latency_test", queue)
+        agent = DummyAgent("latency_test", queue, max_messages=16)
         agent.start()
-        time.sleep(0.5)
         
         # Send message and measure response time
         start_time = time.time()
@@ -543,7 +589,7 @@ class TestPerformance(unittest.TestCase):
         queue.send(msg)
         
         # Wait for processing
-        time.sleep(0.2)
+        self.assertTrue(agent._idle_after_process.wait(timeout=2.0))
         
         elapsed = time.time() - start_time
         
@@ -555,6 +601,13 @@ class TestPerformance(unittest.TestCase):
 
 # ==================== RUN TESTS ====================
 
+def _run_suite(suite):
+    """Run one TestCase class's suite, capturing its report"""
+    stream = io.StringIO()
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return stream.getvalue(), result
+
+
 def run_tests():
     """Run all tests with verbose output"""
     
@@ -563,34 +616,38 @@ def run_tests():
     print("="*60)
     print()
     
-    # Create test suite
+    # One suite per TestCase class; the classes share no state, so run
+    # them side by side. TestPerformance asserts on throughput/latency, so
+    # it runs alone afterwards rather than competing with the others for
+    # the GIL.
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-
-      # Add all test classes
-    suite.addTests(loader.loadTestsFromTestCase(TestMessage))
-    suite.addTests(loader.loadTestsFromTestCase(TestMessageQueue))
-    suite.addTests(loader.loadTestsFromTestCase(TestBaseAgent))
-    suite.addTests(loader.loadTestsFromTestCase(TestSupervisorAgent))
-    suite.addTests(loader.loadTestsFromTestCase(TestMultiAgentSystem))
-    suite.addTests(loader.loadTestsFromTestCase(TestAgentCommunication))
-    suite.addTests(loader.loadTestsFromTestCase(TestPerformance))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    suites = [s for s in loader.loadTestsFromModule(sys.modules[__name__])
+              if s.countTestCases()]
+    parallel, timed = [], []
+    for suite in suites:
+        (timed if isinstance(next(iter(suite)), TestPerformance) else parallel).append(suite)
+    with ThreadPoolExecutor(max_workers=len(parallel)) as executor:
+        outcomes = list(executor.map(_run_suite, parallel))
+    outcomes.extend(map(_run_suite, timed))
+    
+    tests_run = failures = errors = 0
+    for report, result in outcomes:
+        print(report)
+        tests_run += result.testsRun
+        failures += len(result.failures)
+        errors += len(result.errors)
     
     # Summary
     print("\n" + "="*60)
     print("📊 TEST SUMMARY")
     print("="*60)
-    print(f"Tests run: {result.testsRun}")
-    print(f"✅ Passed: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"❌ Failed: {len(result.failures)}")
-    print(f"💥 Errors: {len(result.errors)}")
+    print(f"Tests run: {tests_run}")
+    print(f"✅ Passed: {tests_run - failures - errors}")
+    print(f"❌ Failed: {failures}")
+    print(f"💥 Errors: {errors}")
     print("="*60)
     
-    return result.wasSuccessful()
+    return all(result.wasSuccessful() for _, result in outcomes)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,57 @@
+"""
+PDF Reader - Test Suite
+Tests for multi-term search in tools/pdf_reader.py
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from tools import pdf_reader
+from tools.pdf_reader import PDFReader
+
+
+PAGES = [
+    "aaaa banana bananas, ANA and Ana",
+    "abababab nanana ab",
+    "no hits here",
+]
+TERMS = ['aa', 'ana', 'ANA', 'ab', 'abab', 'nan', 'missing']
+
+
+class TestSearchTexts(unittest.TestCase):
+    """search_texts must agree with search_text, with or without ahocorasick"""
+
+    def setUp(self):
+        with redirect_stdout(io.StringIO()):
+            self.reader = PDFReader(backend='pypdf')
+        self.reader.iter_pages = lambda pdf_path, max_pages=None: iter(PAGES)
+
+    def _search_texts(self, automaton_module):
+        with mock.patch.object(pdf_reader, 'ahocorasick', automaton_module), \
+                redirect_stdout(io.StringIO()):
+            return self.reader.search_texts('paper.pdf', TERMS)
+
+    def test_matches_search_text(self):
+        with redirect_stdout(io.StringIO()):
+            expected = {term: self.reader.search_text('paper.pdf', term) for term in TERMS}
+
+        paths = {'fallback': None}
+        if pdf_reader.ahocorasick is not None:
+            paths['ahocorasick'] = pdf_reader.ahocorasick
+
+        for path, module in paths.items():
+            with self.subTest(path=path):
+                self.assertEqual(self._search_texts(module), expected)
+
+    @unittest.skipIf(pdf_reader.ahocorasick is None, "pyahocorasick not installed")
+    def test_automaton_matches_fallback(self):
+        self.assertEqual(
+            self._search_texts(pdf_reader.ahocorasick),
+            self._search_texts(None)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
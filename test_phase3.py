@@ -3,10 +3,12 @@ test_phase3.py
 Quick test for Phase 3 system
 """
 
-from agents.innovator_agent import InnovatorAgent
-from agents.writer_agent import WriterAgent
-from tools.llm_wrapper import LLMWrapper
-from demo_phase1 import MessageQueue
+from tools.import_utils import cached_import
+
+InnovatorAgent = cached_import('agents.innovator_agent', 'InnovatorAgent')
+WriterAgent = cached_import('agents.writer_agent', 'WriterAgent')
+LLMWrapper = cached_import('tools.llm_wrapper', 'LLMWrapper')
+MessageQueue = cached_import('demo_phase1', 'MessageQueue')
 
 print("Testing Phase 3 agents...")
 
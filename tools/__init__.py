@@ -5,5 +5,6 @@ Utility tools for the multi-agent system
 
 from .llm_wrapper import LLMWrapper, create_llm
 from .pdf_reader import PDFReader
+from .import_utils import cached_import
 
-__all__ = ['LLMWrapper', 'create_llm', 'PDFReader']
+__all__ = ['LLMWrapper', 'create_llm', 'PDFReader', 'cached_import']
@@ -0,0 +1,22 @@
+"""
+tools/import_utils.py
+Helpers for importing classes by module path
+"""
+
+import sys
+from importlib import import_module
+from typing import Any
+
+
+def cached_import(module_name: str, item_name: str) -> Any:
+    """
+    Return an attribute of a module, importing the module only if needed
+    
+    Args:
+        module_name: Dotted module path (e.g. 'agents.writer_agent')
+        item_name: Attribute to fetch from the module
+    """
+    modules = sys.modules
+    if module_name not in modules:
+        import_module(module_name)
+    return getattr(modules[module_name], item_name)
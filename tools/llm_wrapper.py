@@ -5,12 +5,79 @@ Unified LLM interface using Groq for fast inference
 
 
 from groq import Groq
+import asyncio
+import hashlib
 import json
 import os
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict, deque
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from dotenv import load_dotenv
 import time
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import tiktoken  # Optional: exact BPE token counts
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson  # Optional: faster JSON parsing/serialization
+except ImportError:
+    orjson = None
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON, using orjson when it is installed (raises json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps(data: Any) -> str:
+    """Pretty-print JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    """Shared cl100k_base encoder, or None if tiktoken is unavailable"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:  # e.g. BPE file can't be downloaded
+        return None
+
+
+class _RateLimiter:
+    """Sliding-window limiter: at most max_calls acquisitions per period seconds"""
+
+    def __init__(self, max_calls: int, period: float = 60.0):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Record a call if it fits in the window; otherwise return the wait in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return 0.0
+            return self.period - (now - self._calls[0])
+
+    def acquire(self):
+        """Block until another call fits in the window"""
+        while (wait := self._try_acquire()) > 0:
+            time.sleep(wait)
 
 
 class LLMWrapper:
@@ -26,7 +93,24 @@ class LLMWrapper:
         'efficient': 'gemma-7b-it'             # Most efficient
     }
 
-    def __init__(self, api_key: Optional[str] = None, model: str = 'best'):
+    # Response cache for deterministic calls (temperature at or near 0)
+    CACHE_MAX_TEMPERATURE = 0.05
+    CACHE_SIZE = 512
+    CACHE_TTL = 3600  # seconds
+
+    JSON_SYSTEM_PROMPT = "You are a precise JSON generator. Always return valid JSON with no additional text."
+
+    # Groq free tier allows 30 requests per minute
+    RATE_LIMIT_RPM = 30
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = 'best',
+        semantic_cache: bool = False,
+        sim_threshold: float = 0.92,
+        rpm: Optional[int] = None
+    ):
 
          """
         Initialize Groq client
@@ -34,6 +118,10 @@ class LLMWrapper:
         Args:
             api_key: Groq API key (or loads from .env)
             model: Model preference ('best', 'fast', 'reasoning', 'efficient')
+            semantic_cache: Reuse responses for near-duplicate prompts
+                (needs sentence-transformers)
+            sim_threshold: Cosine similarity required for a semantic cache hit
+            rpm: Requests per minute allowed to the API (default RATE_LIMIT_RPM)
         """
          
          # Load environment variables
@@ -55,10 +143,29 @@ class LLMWrapper:
           # Set model
          self.model = self.MODELS.get(model, self.MODELS['best'])
         
-         # Stats tracking
+         # Stats tracking (updated from batch worker threads, so changes go
+         # through _record() under a lock)
+         self._stats_lock = threading.Lock()
          self.total_tokens = 0
          self.total_calls = 0
          self.total_errors = 0
+
+         # Requests wait for a free slot instead of hitting 429s and retrying;
+         # every call path (including batches) shares this one limiter
+         self._rate_limiter = _RateLimiter(rpm or self.RATE_LIMIT_RPM, 60.0)
+
+         # Exact-match response cache: key -> (expires_at, response text)
+         self._response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+         self._cache_lock = threading.Lock()  # Guards both response caches
+         self.cache_hits = 0
+         self.cache_misses = 0
+
+         # Optional near-duplicate prompt cache
+         self.semantic_cache = None
+         self.semantic_hits = 0
+         if semantic_cache:
+             from .semantic_cache import SemanticLLMCache
+             self.semantic_cache = SemanticLLMCache(threshold=sim_threshold)
         
          print(f"✅ Groq LLM initialized with model: {self.model}")
 
@@ -84,21 +191,32 @@ class LLMWrapper:
         """
           
           try:
-            # Build messages
-            messages = []
-            
-            if system_prompt:
-                messages.append({
-                    "role": "system",
-                    "content": system_prompt
-                })
-            
-            messages.append({
-                "role": "user",
-                "content": prompt
-            })
+            messages = self._build_messages(prompt, system_prompt)
+
+            # Deterministic calls can be answered from the response cache
+            cache_key = None
+            if temperature <= self.CACHE_MAX_TEMPERATURE:
+                cache_key = self._cache_key(messages, max_tokens, temperature)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    self._record(cache_hits=1)
+                    print("✅ LLM response served from cache")
+                    return cached
+                self._record(cache_misses=1)
+
+            # Paraphrased prompts can be answered from the semantic cache
+            if self.semantic_cache is not None:
+                semantic_context = (self.model, system_prompt, max_tokens)
+                embedding = self.semantic_cache.embed(prompt)
+                with self._cache_lock:
+                    cached = self.semantic_cache.lookup(semantic_context, embedding)
+                if cached is not None:
+                    self._record(semantic_hits=1)
+                    print("✅ LLM response served from semantic cache")
+                    return cached
 
-             # Call Groq API
+             # Call Groq API (waiting first if the per-minute budget is spent)
+            self._rate_limiter.acquire()
             start_time = time.time()
             
             response = self.client.chat.completions.create(
@@ -115,18 +233,130 @@ class LLMWrapper:
             result = response.choices[0].message.content
             
             # Update stats
-            self.total_tokens += response.usage.total_tokens
-            self.total_calls += 1
+            self._record(total_tokens=response.usage.total_tokens, total_calls=1)
             
             print(f"✅ LLM call completed in {elapsed:.2f}s ({response.usage.total_tokens} tokens)")
             
+            if cache_key is not None:
+                self._cache_put(cache_key, result)
+            if self.semantic_cache is not None:
+                with self._cache_lock:
+                    self.semantic_cache.add(semantic_context, embedding, result)
+            
             return result
 
           except Exception as e:
-            self.total_errors += 1
+            self._record(total_errors=1)
             print(f"❌ LLM error: {e}")
             raise  
         
+    def generate_stream(
+        self,
+        prompt: str,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Generate text, yielding pieces as soon as the model produces them
+        
+        Args are the same as generate(). Streamed responses are not cached.
+        
+        Yields:
+            Text chunks of the response, in order
+        """
+        messages = self._build_messages(prompt, system_prompt)
+        self._rate_limiter.acquire()
+        
+        usage = None
+        failed = False
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=0.95,
+                stream=True
+            )
+            
+            for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
+                # Groq reports usage on the final chunk
+                chunk_usage = getattr(chunk, 'usage', None) or getattr(
+                    getattr(chunk, 'x_groq', None), 'usage', None
+                )
+                if chunk_usage:
+                    usage = chunk_usage
+        
+        except Exception as e:
+            failed = True
+            self._record(total_errors=1)
+            print(f"❌ LLM error: {e}")
+            raise
+        
+        finally:
+            # Also runs when the consumer stops early (the generator is closed);
+            # usage is only known if the final chunk was reached
+            if not failed:
+                self._record(total_calls=1, total_tokens=usage.total_tokens if usage else 0)
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_prompt: Optional[str]) -> List[Dict[str, str]]:
+        """Chat messages for a prompt and optional system instruction"""
+        messages = []
+        
+        if system_prompt:
+            messages.append({
+                "role": "system",
+                "content": system_prompt
+            })
+        
+        messages.append({
+            "role": "user",
+            "content": prompt
+        })
+        return messages
+
+    def _cache_key(self, messages: List[Dict[str, str]], max_tokens: int, temperature: float) -> str:
+        """Hash of everything that determines a response"""
+        request = json.dumps(
+            {"m": self.model, "msgs": messages, "mt": max_tokens, "t": temperature},
+            sort_keys=True
+        )
+        return hashlib.sha256(request.encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Cached response for key, or None if missing or expired"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: str, result: str):
+        """Store a response, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._response_cache[key] = (time.monotonic() + self.CACHE_TTL, result)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self.CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop all cached responses"""
+        with self._cache_lock:
+            self._response_cache.clear()
+            if self.semantic_cache is not None:
+                self.semantic_cache.clear()
+
     def generate_structured(
         self,
         prompt: str,
@@ -137,6 +367,11 @@ class LLMWrapper:
         """
         Generate JSON response matching a schema
         
+        The system prompt, schema and instructions come before the user
+        request, so calls sharing a schema share a long identical prompt
+        prefix (reusable by provider-side prompt caching). Pass the same
+        schema dict, with the same key order, to keep that prefix stable.
+        
         Args:
             prompt: User prompt
             schema: Expected JSON schema
@@ -146,19 +381,22 @@ class LLMWrapper:
         Returns:
             Parsed JSON object
         """
-        # Add JSON instruction to prompt
-        schema_str = json.dumps(schema, indent=2)
+        # Static schema and JSON instructions first, the varying request last
+        schema_str = _json_dumps(schema)
         
-        full_prompt = f"""{prompt}
-
-IMPORTANT: Respond with ONLY valid JSON matching this schema:
+        full_prompt = f"""Schema:
 {schema_str}
 
+IMPORTANT: Respond with ONLY valid JSON matching the schema above.
+
 Do not include any explanation or markdown formatting.
 
-Return pure JSON that can be parsed directly."""
+Return pure JSON that can be parsed directly.
+
+User request:
+{prompt}"""
         
-        system_prompt = "You are a precise JSON generator. Always return valid JSON with no additional text."
+        system_prompt = self.JSON_SYSTEM_PROMPT
         
         # Generate response
         response_text = self.generate(
@@ -171,17 +409,17 @@ Return pure JSON that can be parsed directly."""
         # Parse JSON
         try:
             # Try direct parse
-            return json.loads(response_text)
+            return _json_loads(response_text)
         except json.JSONDecodeError:
             # Try to extract JSON from markdown code blocks
             json_match = re.search(r'```json\s*\n(.*?)\n```', response_text, re.DOTALL)
             if json_match:
-                return json.loads(json_match.group(1))
+                return _json_loads(json_match.group(1))
             
             # Try to find JSON object in text
             json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
             if json_match:
-                return json.loads(json_match.group(0))
+                return _json_loads(json_match.group(0))
             
             # If all fails, raise error
             raise ValueError(f"Could not parse JSON from response: {response_text[:200]}")
@@ -217,15 +455,63 @@ Return pure JSON that can be parsed directly."""
         
         raise last_error
     
+    async def abatch_generate(
+        self,
+        prompts: List[str],
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        max_concurrency: int = 10
+    ) -> List[Optional[str]]:
+        """
+        Generate responses for multiple prompts concurrently
+        
+        Requests overlap instead of running back to back; each one still
+        waits on the wrapper's rate limiter (see the rpm argument of
+        __init__), so cache hits don't use up the per-minute budget.
+        
+        Args:
+            prompts: List of prompts
+            max_tokens: Max tokens per response
+            temperature: Sampling temperature
+            max_concurrency: Maximum requests in flight at once
+        
+        Returns:
+            List of responses (None for failed prompts), in prompt order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        total = len(prompts)
+        
+        async def run_one(i: int, prompt: str) -> Optional[str]:
+            async with semaphore:
+                print(f"Processing prompt {i + 1}/{total}...")
+                try:
+                    # generate() is blocking (including its wait for a
+                    # rate-limit slot), so run it on a worker thread
+                    return await asyncio.to_thread(
+                        self.generate,
+                        prompt=prompt,
+                        max_tokens=max_tokens,
+                        temperature=temperature
+                    )
+                except Exception as e:
+                    print(f"❌ Prompt {i + 1} failed: {e}")
+                    return None
+        
+        return list(await asyncio.gather(*(run_one(i, p) for i, p in enumerate(prompts))))
+    
     def batch_generate(
         self,
         prompts: List[str],
         max_tokens: int = 1000,
         temperature: float = 0.7
-    ) -> List[str]:
+    ) -> List[Optional[str]]:
         """
         Generate responses for multiple prompts
         
+        Blocking wrapper around abatch_generate(); async code should await
+        that directly. Called from inside a running event loop (Jupyter,
+        async handlers), the batch runs on a separate thread with its own loop.
+        
         Args:
             prompts: List of prompts
             max_tokens: Max tokens per response
@@ -234,56 +520,81 @@ Return pure JSON that can be parsed directly."""
         Returns:
             List of responses
         """
-        results = []
+        def run_batch() -> List[Optional[str]]:
+            return asyncio.run(self.abatch_generate(
+                prompts,
+                max_tokens=max_tokens,
+                temperature=temperature
+            ))
         
-        for i, prompt in enumerate(prompts):
-            print(f"Processing prompt {i + 1}/{len(prompts)}...")
-            
-            try:
-                response = self.generate(
-                    prompt=prompt,
-                    max_tokens=max_tokens,
-                    temperature=temperature
-                )
-                results.append(response)
-            except Exception as e:
-                print(f"❌ Prompt {i + 1} failed: {e}")
-                results.append(None)
-            
-            # Rate limiting (30 req/min = 2 sec between calls)
-            if i < len(prompts) - 1:
-                time.sleep(2)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return run_batch()
         
-        return results
+        # asyncio.run() refuses to nest inside a running loop
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(run_batch).result()
     
     def count_tokens(self, text: str) -> int:
         """
-        Estimate token count (rough approximation)
+        Count tokens (cl100k_base BPE via tiktoken, else a rough estimate)
         
         Args:
             text: Input text
         
         Returns:
-            Estimated token count
+            Token count
         """
+        encoding = _token_encoding()
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        
         # Rough estimate: 1 token ≈ 4 characters
         return len(text) // 4
     
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Token counts for several texts (encoded in parallel when tiktoken is available)"""
+        encoding = _token_encoding()
+        if encoding is not None:
+            encoded = encoding.encode_batch(
+                texts, num_threads=os.cpu_count() or 1, disallowed_special=()
+            )
+            return [len(tokens) for tokens in encoded]
+        
+        return [len(text) // 4 for text in texts]
+    
+    def _record(self, **deltas: int):
+        """Add to one or more stats counters atomically"""
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get usage statistics"""
-        return {
-            'total_calls': self.total_calls,
-            'total_tokens': self.total_tokens,
-            'total_errors': self.total_errors,
-            'model': self.model,
-            'avg_tokens_per_call': self.total_tokens / max(self.total_calls, 1)
-        }
+        with self._stats_lock:
+            stats = {
+                'total_calls': self.total_calls,
+                'total_tokens': self.total_tokens,
+                'total_errors': self.total_errors,
+                'model': self.model,
+                'avg_tokens_per_call': self.total_tokens / max(self.total_calls, 1),
+                'cache_hits': self.cache_hits,
+                'cache_misses': self.cache_misses,
+                'cache_size': len(self._response_cache),
+                'semantic_hits': self.semantic_hits
+            }
+        return stats
     
     def reset_stats(self):
         """Reset usage statistics"""
-        self.total_tokens = 0
-        self.total_calls = 0
-        self.total_errors = 0
+        with self._stats_lock:
+            self.total_tokens = 0
+            self.total_calls = 0
+            self.total_errors = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.semantic_hits = 0
 
 # ==================== HELPER FUNCTIONS ====================
 
@@ -339,7 +650,7 @@ def demo_llm():
         schema=schema,
         temperature=0.3
     )
-    print(json.dumps(json_response, indent=2))
+    print(_json_dumps(json_response))
     
     # Test 3: Batch generation
     print("\n🔄 Test 3: Batch Processing")
@@ -360,7 +671,7 @@ def demo_llm():
     print("\n📈 Usage Statistics")
     print("-" * 60)
     stats = llm.get_stats()
-    print(json.dumps(stats, indent=2))
+    print(_json_dumps(stats))
     
     print("\n✅ Demo complete!")
 
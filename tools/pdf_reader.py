@@ -4,9 +4,322 @@ Extract text and metadata from research papers (PDF)
 """
 
 from pypdf import PdfReader
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Iterator, Tuple, Union
+import copy
+import gzip
+import hashlib
+import io
+import mmap
+import multiprocessing
 import re
 import os
+import threading
+
+try:
+    import ahocorasick  # Optional: single-pass multi-term search
+except ImportError:
+    ahocorasick = None
+
+try:
+    import fitz  # Optional: PyMuPDF, a much faster C extraction backend
+except ImportError:
+    fitz = None
+
+try:
+    import zstandard  # Optional: faster compression for the text cache
+except ImportError:
+    zstandard = None
+
+
+# ==================== PATTERNS ====================
+# Compiled once here rather than on every call / page
+
+# Abstract headings ("Abstract:", "Abstract—", "ABSTRACT\n", ...) and body,
+# matched at a known "abstract" offset within a bounded window
+_ABSTRACT_RES = [
+    re.compile(p, re.DOTALL | re.IGNORECASE) for p in (
+        r'abstract[:\-—]\s*(.*?)(?=\n\s*\n|\n\s*1\.|\n\s*introduction|$)',
+        r'abstract\s*\n\s*(.*?)(?=\n\s*\n|\n\s*1\.|\n\s*introduction|$)',
+    )
+]
+_ABSTRACT_WINDOW = 2000  # Characters scanned after the heading
+
+# Section names as regex alternatives (in match-priority order), each with
+# the literal every match contains
+_SECTION_NAMES = (
+    ('introduction', 'introduction'),
+    ('background', 'background'),
+    ('related work', 'related work'),
+    ('methodology', 'methodology'),
+    ('method', 'method'),
+    ('approach', 'approach'),
+    ('experiments?', 'experiment'),
+    ('results?', 'result'),
+    ('evaluation', 'evaluation'),
+    ('discussion', 'discussion'),
+    ('conclusion', 'conclusion'),
+    ('references?', 'reference'),
+)
+
+
+@lru_cache(maxsize=128)
+def _section_patterns(names: Tuple[str, ...]) -> List["re.Pattern"]:
+    """
+    Section heading patterns restricted to the given alternatives: numbered
+    ("2. Method") or on a line of their own (references only when numbered)
+    """
+    numbered = '|'.join(names)
+    standalone = '|'.join(name for name in names if name != 'references?')
+    patterns = [re.compile(rf'^\s*\d+\.?\s+({numbered})', re.IGNORECASE | re.MULTILINE)]
+    if standalone:
+        patterns.append(re.compile(rf'^\s*({standalone})\s*\n', re.IGNORECASE | re.MULTILINE))
+    return patterns
+
+_REF_SECTION_RE = re.compile(
+    r'(references?|bibliography)\s*\n\s*(.*?)(?=\n\s*appendix|\Z)',
+    re.DOTALL | re.IGNORECASE
+)
+_REF_LINE_RE = re.compile(r'^\[?\d+\]?\.?\s+')  # "[1] ", "1. ", ...
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PAGENUM_RE = re.compile(r'\n\s*\d+\s*\n')
+_COLUMN_GAP_RE = re.compile(r'\s{3,}')
+
+
+def _find_all(text: str, needle: str):
+    """Start offsets of non-overlapping occurrences of a non-empty literal"""
+    find = text.find
+    step = len(needle)
+    start = find(needle)
+    while start != -1:
+        yield start
+        start = find(needle, start + step)
+
+
+def _non_overlapping(hits: Iterator[Tuple[str, int]]) -> Iterator[Tuple[str, int]]:
+    """
+    Drop (needle, start) hits that overlap an earlier hit of the same needle
+
+    Aho-Corasick reports every occurrence ("aa" twice in "aaa"); this keeps
+    the leftmost non-overlapping ones, as _find_all does. Hits must come in
+    order of their end offset, which is the order automaton.iter() yields.
+    """
+    next_free: Dict[str, int] = {}
+    for needle, start in hits:
+        if start >= next_free.get(needle, 0):
+            next_free[needle] = start + len(needle)
+            yield needle, start
+
+
+def _file_key(pdf_path: str) -> Optional[Tuple[str, int, int]]:
+    """(absolute path, mtime_ns, size) identifying a file's current contents, None if unreadable"""
+    try:
+        st = os.stat(pdf_path)
+    except OSError:
+        return None
+    return os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size
+
+
+class _PyMuPDFPage:
+    """pypdf-style page: extract_text()"""
+
+    def __init__(self, page):
+        self._page = page
+
+    def extract_text(self) -> str:
+        return self._page.get_text("text")
+
+
+class _PyMuPDFPages:
+    """pypdf-style page sequence over a PyMuPDF document"""
+
+    def __init__(self, doc):
+        self._doc = doc
+
+    def __len__(self) -> int:
+        return self._doc.page_count
+
+    def __getitem__(self, i: int) -> _PyMuPDFPage:
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        return _PyMuPDFPage(self._doc[i])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+class _PyMuPDFReader:
+    """
+    Read-only PyMuPDF document exposing the parts of pypdf's PdfReader
+    interface PDFReader uses (pages[i].extract_text(), metadata)
+    """
+
+    # PyMuPDF metadata key -> pypdf document info key
+    _METADATA_KEYS = {
+        'title': '/Title',
+        'author': '/Author',
+        'subject': '/Subject',
+        'creator': '/Creator',
+        'producer': '/Producer',
+        'creationDate': '/CreationDate',
+    }
+
+    def __init__(self, pdf_path: str):
+        self._doc = fitz.open(pdf_path)
+        self.pages = _PyMuPDFPages(self._doc)
+        meta = self._doc.metadata or {}
+        self.metadata = {
+            pypdf_key: meta[key]
+            for key, pypdf_key in self._METADATA_KEYS.items()
+            if meta.get(key)
+        }
+
+    def close(self):
+        self._doc.close()
+
+
+def _resolve_backend(backend: str) -> str:
+    """'auto' -> 'pymupdf' when PyMuPDF is installed, else 'pypdf'"""
+    if backend == 'auto':
+        return 'pymupdf' if fitz is not None else 'pypdf'
+    if backend == 'pymupdf' and fitz is None:
+        raise ImportError("The pymupdf backend needs PyMuPDF: pip install pymupdf")
+    if backend not in ('pymupdf', 'pypdf'):
+        raise ValueError(f"Unknown PDF backend: {backend}")
+    return backend
+
+
+def _open_pdf(pdf_path: str, backend: str):
+    """Open a PDF with a resolved backend"""
+    if backend == 'pymupdf':
+        return _PyMuPDFReader(pdf_path)
+    return PdfReader(pdf_path)
+
+
+def _close_pdf(reader):
+    """Release a reader returned by _open_pdf"""
+    if isinstance(reader, _PyMuPDFReader):
+        reader.close()
+    else:
+        reader.stream.close()
+
+
+def _extract_pages(pdf_path: str, start: int, stop: int, backend: str = 'pypdf') -> List[str]:
+    """Text of pages [start, stop); runs in a worker process with its own reader"""
+    reader = _open_pdf(pdf_path, backend)
+    try:
+        return [reader.pages[i].extract_text() for i in range(start, stop)]
+    finally:
+        _close_pdf(reader)
+
+
+# ==================== TEXT CACHE ====================
+# Extracted text can be kept on disk, keyed by a hash of the PDF's bytes, so
+# re-running a pipeline over the same papers skips extraction entirely.
+# Opt-in (nothing is evicted): pass cache_dir, e.g. DEFAULT_CACHE_DIR.
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdfreader')
+_CACHE_SUFFIX = '.txt.zst' if zstandard is not None else '.txt.gz'
+
+
+def _content_hash(pdf_path: str) -> str:
+    """blake2b digest of a file's contents (memory-mapped, no extra copy)"""
+    with open(pdf_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b(b'', digest_size=16).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _read_text_cache(cache_path: str) -> Optional[str]:
+    """Cached text, or None if there is no (readable) entry"""
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    try:
+        if zstandard is not None:
+            data = zstandard.ZstdDecompressor().decompress(data)
+        else:
+            data = gzip.decompress(data)
+        return data.decode('utf-8')
+    except Exception:  # Corrupt entry: treat as a miss
+        return None
+
+
+def _write_text_cache(cache_path: str, text: str):
+    """Store text atomically; failures (e.g. read-only home) are ignored"""
+    data = text.encode('utf-8')
+    if zstandard is not None:
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+    else:
+        data = gzip.compress(data, compresslevel=6)
+    
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+@dataclass
+class SearchResults:
+    """
+    Search hits stored column-wise: packed page numbers and positions plus
+    the context strings, instead of one dict per hit
+    
+    Indexing and iteration still give {'page', 'context', 'position'} dicts;
+    to_list() materializes them for the public search API.
+    """
+    pages: array = field(default_factory=lambda: array('I'))
+    positions: array = field(default_factory=lambda: array('Q'))
+    contexts: List[str] = field(default_factory=list)
+
+    def add(self, text: str, page_num: int, start: int, end: int):
+        """Record a hit on 0-based page page_num, with 50 characters of context either side"""
+        self.pages.append(page_num + 1)
+        self.positions.append(start)
+        self.contexts.append(text[max(0, start - 50):min(len(text), end + 50)])
+
+    def _match(self, i: int) -> Dict[str, Any]:
+        return {
+            'page': self.pages[i],
+            'context': self.contexts[i],
+            'position': self.positions[i]
+        }
+
+    def __len__(self) -> int:
+        return len(self.contexts)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        if isinstance(index, slice):
+            return [self._match(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._match(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return map(self._match, range(len(self)))
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
 
 class PDFReader:
     """
@@ -18,11 +331,70 @@ class PDFReader:
     - Identify abstract
     - Extract sections
     - Handle multi-column layouts
+    
+    Text is extracted with PyMuPDF when it is installed (backend='auto'),
+    otherwise with pypdf.
     """
 
-    def __init__(self):
+    # pypdf extraction is CPU-bound pure Python; larger documents are
+    # split across worker processes
+    PARALLEL_MIN_PAGES = 20
+
+    # Parsed documents kept open (per thread), so repeated calls on one PDF
+    # skip re-parsing
+    MAX_OPEN_READERS = 8
+
+    # Paper info / text stats / validation results remembered per reader
+    RESULT_CACHE_SIZE = 64
+
+    def __init__(self, backend: str = 'auto', cache_dir: Optional[str] = None):
+        """
+        Args:
+            backend: 'auto', 'pymupdf' or 'pypdf'
+            cache_dir: Directory for the extracted-text cache, e.g.
+                DEFAULT_CACHE_DIR (None = disabled, the default)
+        """
         self.supported_extensions = ['.pdf']
-        print("✅ PDF Reader initialized")
+        self.backend = _resolve_backend(backend)
+        self.cache_dir = cache_dir
+        # Readers aren't thread-safe, so each thread keeps its own
+        self._local = threading.local()
+        self._paper_info_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._text_stats_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._readability_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._results_lock = threading.Lock()
+        print(f"✅ PDF Reader initialized ({self.backend})")
+    
+    def _thread_readers(self) -> "OrderedDict[Tuple[str, int], PdfReader]":
+        """This thread's reader cache"""
+        readers = getattr(self._local, 'readers', None)
+        if readers is None:
+            readers = self._local.readers = OrderedDict()
+        return readers
+    
+    def _get_reader(self, pdf_path: str) -> PdfReader:
+        """Parsed reader for a PDF, reused by this thread while the file is unchanged"""
+        key = (os.path.abspath(pdf_path), os.stat(pdf_path).st_mtime_ns)
+        readers = self._thread_readers()
+        reader = readers.get(key)
+        if reader is not None:
+            readers.move_to_end(key)
+            return reader
+        
+        reader = _open_pdf(pdf_path, self.backend)
+        readers[key] = reader
+        while len(readers) > self.MAX_OPEN_READERS:
+            # Only dropped, not closed: a page iterator handed out earlier
+            # may still be reading it; it is released once unreferenced
+            readers.popitem(last=False)
+        return reader
+    
+    def close(self):
+        """Release the readers cached by the calling thread"""
+        readers = self._thread_readers()
+        for reader in readers.values():
+            _close_pdf(reader)
+        readers.clear()
     
 
     def extract_text(self, pdf_path: str, max_pages: Optional[int] = None) -> str:
@@ -42,30 +414,47 @@ class PDFReader:
         if not pdf_path.lower().endswith('.pdf'):
             raise ValueError(f"Not a PDF file: {pdf_path}")
         
+        cache_path = self._text_cache_path(pdf_path, max_pages)
+        if cache_path is not None:
+            cached = _read_text_cache(cache_path)
+            if cached is not None:
+                print(f"✅ Loaded {len(cached)} characters of {pdf_path} from cache")
+                return cached
+        
         print(f"📖 Reading PDF: {pdf_path}")
         
         try:
-            reader = PdfReader(pdf_path)
+            reader = self._get_reader(pdf_path)
             num_pages = len(reader.pages)
             
             print(f"   Pages: {num_pages}")
             
             # Extract text from pages
-            text_parts = []
             pages_to_read = min(num_pages, max_pages) if max_pages else num_pages
             
-            for i in range(pages_to_read):
-                page = reader.pages[i]
-                page_text = page.extract_text()
-                text_parts.append(page_text)
-                
-                if (i + 1) % 10 == 0:
-                    print(f"   Processed {i + 1}/{pages_to_read} pages...")
+            page_texts = None
+            # PyMuPDF is already C-speed; workers re-opening the document cost more than they save
+            if (self.backend == 'pypdf' and pages_to_read > self.PARALLEL_MIN_PAGES
+                    and (os.cpu_count() or 1) > 1):
+                page_texts = self._extract_parallel(pdf_path, pages_to_read)
+            
+            if page_texts is None:
+                page_texts = self._iter_reader_pages(reader, pages_to_read, progress=True)
             
-            full_text = '\n\n'.join(text_parts)
+            # Write pages straight into one buffer instead of keeping a
+            # list of page strings alongside the joined text
+            buf = io.StringIO()
+            for i, page_text in enumerate(page_texts):
+                if i:
+                    buf.write('\n\n')
+                buf.write(page_text)
+            full_text = buf.getvalue()
             
             print(f"✅ Extracted {len(full_text)} characters from {pages_to_read} pages")
             
+            if cache_path is not None:
+                _write_text_cache(cache_path, full_text)
+            
             return full_text
             
         except Exception as e:
@@ -73,6 +462,104 @@ class PDFReader:
             raise
     
 
+    def _text_cache_path(self, pdf_path: str, max_pages: Optional[int]) -> Optional[str]:
+        """Cache file for this PDF's contents, backend and page limit (None if disabled)"""
+        if self.cache_dir is None:
+            return None
+        try:
+            digest = _content_hash(pdf_path)
+        except (OSError, ValueError):
+            return None
+        pages = f"p{max_pages}" if max_pages else "all"
+        return os.path.join(self.cache_dir, f"{digest}-{self.backend}-{pages}{_CACHE_SUFFIX}")
+    
+    def iter_pages(self, pdf_path: str, max_pages: Optional[int] = None) -> Iterator[str]:
+        """
+        Yield the text of each page in turn, without holding the whole document
+        
+        Args:
+            pdf_path: Path to PDF file
+            max_pages: Maximum pages to read (None = all)
+        """
+        reader = self._get_reader(pdf_path)
+        num_pages = len(reader.pages)
+        pages_to_read = min(num_pages, max_pages) if max_pages else num_pages
+        return self._iter_reader_pages(reader, pages_to_read)
+    
+    @staticmethod
+    def _iter_reader_pages(reader: PdfReader, num_pages: int, progress: bool = False) -> Iterator[str]:
+        """Text of pages [0, num_pages) of an open reader, one page at a time"""
+        for i in range(num_pages):
+            yield reader.pages[i].extract_text()
+            
+            if progress and (i + 1) % 10 == 0:
+                print(f"   Processed {i + 1}/{num_pages} pages...")
+    
+    def _extract_parallel(self, pdf_path: str, num_pages: int) -> Optional[List[str]]:
+        """
+        Extract pages [0, num_pages) in worker processes
+        
+        Each worker opens its own reader (readers can't be pickled) and
+        handles a contiguous chunk of pages. Workers are spawned rather than
+        forked: agents call this from their threads, and forking a
+        multithreaded process can deadlock on locks held by other threads.
+        Returns None if the pool can't be used, so the caller falls back to
+        serial extraction.
+        """
+        workers = min(os.cpu_count() or 1, 8)
+        chunk = -(-num_pages // (workers * 2))  # Ceil: ~2 chunks per worker
+        bounds = [(start, min(start + chunk, num_pages)) for start in range(0, num_pages, chunk)]
+        
+        parts: Dict[int, List[str]] = {}
+        done = 0
+        try:
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as pool:
+                futures = {
+                    pool.submit(_extract_pages, pdf_path, start, stop, self.backend): start
+                    for start, stop in bounds
+                }
+                for future in as_completed(futures):
+                    texts = future.result()
+                    parts[futures[future]] = texts
+                    done += len(texts)
+                    print(f"   Processed {done}/{num_pages} pages...")
+        except (OSError, BrokenProcessPool) as e:
+            print(f"   ⚠️ Parallel extraction unavailable ({e}), reading serially")
+            return None
+        
+        return [text for start, _ in bounds for text in parts[start]]
+    
+
+    # Results of get_paper_info / get_text_stats / validate_pdf are cached
+    # per file version (path, mtime, size), since a pipeline typically
+    # validates, inspects and then extracts the same PDF
+    
+    def _cached_result(self, cache: "OrderedDict[Tuple, Dict[str, Any]]", pdf_path: str,
+                       compute, cacheable=lambda result: 'error' not in result) -> Dict[str, Any]:
+        """
+        compute(pdf_path), remembered in this reader's cache while the file is
+        unchanged. Failed results (not cacheable) are recomputed next time.
+        """
+        key = _file_key(pdf_path)
+        if key is None:
+            return compute(pdf_path)  # Reports the error
+        key = (pdf_path,) + key
+        
+        with self._results_lock:
+            result = cache.get(key)
+            if result is not None:
+                cache.move_to_end(key)
+                return result
+        
+        result = compute(pdf_path)
+        if cacheable(result):
+            with self._results_lock:
+                cache[key] = result
+                while len(cache) > self.RESULT_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return result
+    
     def get_paper_info(self, pdf_path: str) -> Dict[str, Any]:
         """
         Extract metadata and basic info from PDF
@@ -85,10 +572,13 @@ class PDFReader:
             'sections': [...]
         }
         """
+        return copy.deepcopy(self._cached_result(self._paper_info_cache, pdf_path, self._paper_info))
+    
+    def _paper_info(self, pdf_path: str) -> Dict[str, Any]:
         print(f"📊 Extracting paper info from: {pdf_path}")
         
         try:
-            reader = PdfReader(pdf_path)
+            reader = self._get_reader(pdf_path)
             
             # Get metadata
             metadata = {}
@@ -106,9 +596,10 @@ class PDFReader:
             num_pages = len(reader.pages)
             
             # Extract first few pages for abstract detection
-            first_pages_text = ''
-            for i in range(min(3, num_pages)):  # Check first 3 pages
-                first_pages_text += reader.pages[i].extract_text() + '\n\n'
+            first_pages_text = ''.join(
+                reader.pages[i].extract_text() + '\n\n'
+                for i in range(min(3, num_pages))  # Check first 3 pages
+            )
             
             # Try to extract abstract
             abstract = self._extract_abstract(first_pages_text)
@@ -152,18 +643,26 @@ class PDFReader:
         # - "Abstract—"
         # - "Abstract:"
         
-        patterns = [
-            r'(?i)abstract[:\-—]\s*(.*?)(?=\n\s*\n|\n\s*1\.|\n\s*introduction|$)',
-            r'(?i)abstract\s*\n\s*(.*?)(?=\n\s*\n|\n\s*1\.|\n\s*introduction|$)',
-        ]
+        # Locate "abstract" with a plain substring scan; the patterns are
+        # then only tried at those offsets, over a bounded window
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing shifted offsets; let the regex do the scanning
+            candidates = [m.start() for m in re.finditer('abstract', text, re.IGNORECASE)]
+        else:
+            candidates = list(_find_all(lowered, 'abstract'))
         
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        for pattern in _ABSTRACT_RES:
+            # First (leftmost) heading this pattern accepts
+            match = next(
+                filter(None, (pattern.match(text, idx, idx + _ABSTRACT_WINDOW) for idx in candidates)),
+                None
+            )
             if match:
                 abstract = match.group(1).strip()
                 
                 # Clean up abstract
-                abstract = re.sub(r'\s+', ' ', abstract)  # Remove extra whitespace
+                abstract = _WHITESPACE_RE.sub(' ', abstract)  # Remove extra whitespace
                 abstract = abstract[:1000]  # Limit length
                 
                 if len(abstract) > 50:  # Must be substantial
@@ -175,17 +674,17 @@ class PDFReader:
     def _extract_sections(self, text: str) -> List[str]:
         """Try to identify paper sections"""
         
-        # Common section patterns
-        section_patterns = [
-            r'(?i)^\s*\d+\.?\s+(introduction|background|related work|methodology|method|approach|experiments?|results?|evaluation|discussion|conclusion|references?)',
-            r'(?i)^\s*(introduction|background|related work|methodology|method|approach|experiments?|results?|evaluation|discussion|conclusion)\s*\n'
-        ]
+        # Only build alternations over names that occur at all; most papers
+        # use a handful of them, and often none in the first pages
+        lowered = text.lower()
+        present = tuple(name for name, literal in _SECTION_NAMES if literal in lowered)
+        if not present:
+            return []
         
         sections = []
         
-        for pattern in section_patterns:
-            matches = re.finditer(pattern, text, re.MULTILINE)
-            for match in matches:
+        for pattern in _section_patterns(present):
+            for match in pattern.finditer(text):
                 section_name = match.group(1).strip()
                 if section_name.lower() not in [s.lower() for s in sections]:
                     sections.append(section_name.title())
@@ -201,7 +700,7 @@ class PDFReader:
         """Extract text from specific page range"""
         
         try:
-            reader = PdfReader(pdf_path)
+            reader = self._get_reader(pdf_path)
             num_pages = len(reader.pages)
             
             # Validate range
@@ -222,58 +721,112 @@ class PDFReader:
         """
         Search for text in PDF
         
-        Returns list of matches with page numbers and context
+        Returns matches with page numbers and context
         """
         print(f"🔍 Searching for '{search_term}' in {pdf_path}")
         
         try:
-            reader = PdfReader(pdf_path)
-            matches = []
+            matches = SearchResults()
+            pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+            needle = search_term.lower()
             
-            for page_num, page in enumerate(reader.pages):
-                text = page.extract_text()
-                
-                # Find all occurrences
-                pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+            for page_num, text in enumerate(self.iter_pages(pdf_path)):
+                lowered = text.lower()
                 
-                for match in pattern.finditer(text):
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end]
-                    
-                    matches.append({
-                        'page': page_num + 1,
-                        'context': context,
-                        'position': match.start()
-                    })
+                # Find all occurrences; a plain substring scan is enough unless
+                # lowercasing changed offsets (or the term is empty)
+                if needle and len(lowered) == len(text):
+                    for start in _find_all(lowered, needle):
+                        matches.add(text, page_num, start, start + len(needle))
+                else:
+                    for match in pattern.finditer(text):
+                        matches.add(text, page_num, match.start(), match.end())
             
             print(f"✅ Found {len(matches)} matches")
-            return matches
+            return matches.to_list()
             
         except Exception as e:
             print(f"❌ Search error: {e}")
             return []
         
     
+    def search_texts(self, pdf_path: str, terms: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search for several terms in one pass per page (case-insensitive)
+        
+        Returns {term: matches} with matches as returned by search_text()
+        """
+        print(f"🔍 Searching for {len(terms)} terms in {pdf_path}")
+        
+        results: Dict[str, SearchResults] = {term: SearchResults() for term in terms}
+        # Terms differing only in case share one needle
+        needles: Dict[str, List[str]] = {}
+        for term in terms:
+            if term:
+                needles.setdefault(term.lower(), []).append(term)
+        if not needles:
+            return {term: [] for term in terms}
+        
+        try:
+            automaton = None
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for needle in needles:
+                    automaton.add_word(needle, needle)
+                automaton.make_automaton()
+            
+            for page_num, text in enumerate(self.iter_pages(pdf_path)):
+                lowered = text.lower()
+                if len(lowered) != len(text):
+                    # Lowercasing shifted offsets; fall back to regex for this page
+                    for needle, owners in needles.items():
+                        for match in re.finditer(re.escape(needle), text, re.IGNORECASE):
+                            for term in owners:
+                                results[term].add(text, page_num, match.start(), match.end())
+                    continue
+                
+                if automaton is not None:
+                    # One scan of the page finds every term
+                    hits = _non_overlapping(
+                        (needle, end - len(needle) + 1)
+                        for end, needle in automaton.iter(lowered)
+                    )
+                else:
+                    hits = (
+                        (needle, start)
+                        for needle in needles
+                        for start in _find_all(lowered, needle)
+                    )
+                
+                for needle, start in hits:
+                    for term in needles[needle]:
+                        results[term].add(text, page_num, start, start + len(needle))
+            
+            print(f"✅ Found {sum(map(len, results.values()))} matches")
+            
+        except Exception as e:
+            print(f"❌ Search error: {e}")
+        
+        return {term: matches.to_list() for term, matches in results.items()}
+    
     def extract_references(self, pdf_path: str) -> List[str]:
         """Try to extract references/bibliography"""
         
         print(f"📚 Extracting references from {pdf_path}")
         
         try:
-            reader = PdfReader(pdf_path)
+            reader = self._get_reader(pdf_path)
             num_pages = len(reader.pages)
             
             # References usually in last few pages
-            last_pages_text = ''
             start_page = max(0, num_pages - 5)
-            
-            for i in range(start_page, num_pages):
-                last_pages_text += reader.pages[i].extract_text() + '\n\n'
+            last_pages_text = ''.join(
+                reader.pages[i].extract_text() + '\n\n'
+                for i in range(start_page, num_pages)
+            )
             
             # Look for references section
-            ref_pattern = r'(?i)(references?|bibliography)\s*\n\s*(.*?)(?=\n\s*appendix|\Z)'
-            match = re.search(ref_pattern, last_pages_text, re.DOTALL)
+            match = _REF_SECTION_RE.search(last_pages_text)
             
             if match:
                 ref_text = match.group(2)
@@ -282,21 +835,21 @@ class PDFReader:
                 # Common patterns: [1], (1), 1., numbered lines
                 ref_lines = ref_text.split('\n')
                 references = []
-                current_ref = ''
+                current_ref: List[str] = []  # Lines of the reference being read
                 
                 for line in ref_lines:
                     line = line.strip()
                     
                     # Check if new reference (starts with number)
-                    if re.match(r'^\[?\d+\]?\.?\s+', line):
+                    if _REF_LINE_RE.match(line):
                         if current_ref:
-                            references.append(current_ref.strip())
-                        current_ref = line
+                            references.append(' '.join(current_ref).strip())
+                        current_ref = [line]
                     else:
-                        current_ref += ' ' + line
+                        current_ref.append(line)
                 
                 if current_ref:
-                    references.append(current_ref.strip())
+                    references.append(' '.join(current_ref).strip())
                 
                 print(f"✅ Extracted {len(references)} references")
                 return references[:50]  # Limit to first 50
@@ -310,15 +863,23 @@ class PDFReader:
     def get_text_stats(self, pdf_path: str) -> Dict[str, Any]:
         """Get statistics about the PDF text"""
         
+        return dict(self._cached_result(self._text_stats_cache, pdf_path, self._text_stats))
+    
+    def _text_stats(self, pdf_path: str) -> Dict[str, Any]:
         try:
             text = self.extract_text(pdf_path)
             
+            # One split; counts and lengths come from C-level calls rather
+            # than a per-word Python loop
+            words = text.split()
+            num_words = len(words)
+            
             stats = {
                 'total_characters': len(text),
-                'total_words': len(text.split()),
-                'total_lines': len(text.split('\n')),
+                'total_words': num_words,
+                'total_lines': text.count('\n') + 1,
                 'estimated_tokens': len(text) // 4,  # Rough estimate
-                'avg_word_length': sum(len(word) for word in text.split()) / max(len(text.split()), 1)
+                'avg_word_length': len(''.join(words)) / max(num_words, 1)
             }
             
             return stats
@@ -354,9 +915,26 @@ class PDFReader:
         
         validation['is_pdf'] = True
         
+        readability = self._cached_result(
+            self._readability_cache, pdf_path, self._readability,
+            cacheable=lambda result: result['readable']  # Don't keep read errors
+        )
+        validation.update(copy.deepcopy(readability))
+        return validation
+    
+    def _readability(self, pdf_path: str) -> Dict[str, Any]:
+        """The parts of validate_pdf that need to open the file"""
+        validation = {
+            'valid': False,
+            'readable': False,
+            'num_pages': 0,
+            'has_text': False,
+            'errors': []
+        }
+        
         # Try to read
         try:
-            reader = PdfReader(pdf_path)
+            reader = self._get_reader(pdf_path)
             validation['readable'] = True
             validation['num_pages'] = len(reader.pages)
             
@@ -376,6 +954,13 @@ class PDFReader:
         
         return validation
     
+    def clear_cache(self):
+        """Forget cached paper info, text stats and validation results"""
+        with self._results_lock:
+            self._paper_info_cache.clear()
+            self._text_stats_cache.clear()
+            self._readability_cache.clear()
+    
 
 
 # ==================== HELPER FUNCTIONS ====================
@@ -384,10 +969,10 @@ def clean_text(text: str) -> str:
     """Clean extracted PDF text"""
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove page numbers (common patterns)
-    text = re.sub(r'\n\s*\d+\s*\n', '\n', text)
+    text = _PAGENUM_RE.sub('\n', text)
     
     # Remove headers/footers (heuristic: short lines at top/bottom)
     lines = text.split('\n')
@@ -412,7 +997,7 @@ def extract_tables(text: str) -> List[str]:
     
     for line in lines:
         # Heuristic: if line has 3+ tabs or multiple sequences of spaces
-        if line.count('\t') >= 3 or len(re.findall(r'\s{3,}', line)) >= 3:
+        if line.count('\t') >= 3 or len(_COLUMN_GAP_RE.findall(line)) >= 3:
             table_lines.append(line)
         elif table_lines:
             # End of table
@@ -0,0 +1,88 @@
+"""
+tools/semantic_cache.py
+Optional cache that answers near-duplicate (paraphrased) prompts
+"""
+
+from typing import Dict, Hashable, List, Optional
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Optional: only needed when semantic caching is enabled
+    np = None
+    SentenceTransformer = None
+
+
+class SemanticLLMCache:
+    """
+    Cache of LLM responses looked up by prompt similarity
+
+    Prompts are embedded with a small local sentence-transformers model
+    (normalized, so a dot product is the cosine similarity). Entries are
+    grouped by a context key (model, system prompt, ...) so a response is
+    only reused for an equivalent request.
+    """
+
+    MODEL_NAME = 'all-MiniLM-L6-v2'
+
+    def __init__(self, threshold: float = 0.92, max_entries: int = 1000):
+        """
+        Args:
+            threshold: Minimum cosine similarity to count as a hit
+            max_entries: Entries kept per context (oldest dropped first),
+                which bounds the cost of the linear scan
+        """
+        if SentenceTransformer is None:
+            raise ImportError(
+                "Semantic caching needs sentence-transformers and numpy: "
+                "pip install sentence-transformers"
+            )
+
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._model = SentenceTransformer(self.MODEL_NAME)
+        # context -> (embedding matrix of shape (N, dim), N responses)
+        self._matrices: Dict[Hashable, "np.ndarray"] = {}
+        self._responses: Dict[Hashable, List[str]] = {}
+
+    def embed(self, prompt: str) -> "np.ndarray":
+        """Normalized embedding of a prompt"""
+        return self._model.encode(prompt, normalize_embeddings=True).astype(np.float32)
+
+    def lookup(self, context: Hashable, embedding: "np.ndarray") -> Optional[str]:
+        """Cached response for the most similar prompt, if similar enough"""
+        matrix = self._matrices.get(context)
+        if matrix is None:
+            return None
+
+        sims = matrix @ embedding  # One matrix-vector product over all entries
+        best = int(sims.argmax())
+        if sims[best] >= self.threshold:
+            return self._responses[context][best]
+        return None
+
+    def add(self, context: Hashable, embedding: "np.ndarray", response: str):
+        """Store a response under its prompt embedding"""
+        matrix = self._matrices.get(context)
+        responses = self._responses.setdefault(context, [])
+
+        if matrix is None:
+            matrix = embedding[np.newaxis, :]
+        else:
+            matrix = np.vstack((matrix, embedding))
+        responses.append(response)
+
+        if len(responses) > self.max_entries:
+            overflow = len(responses) - self.max_entries
+            matrix = matrix[overflow:]
+            del responses[:overflow]
+
+        self._matrices[context] = matrix
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._matrices.clear()
+        self._responses.clear()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self._responses.values())